@@ -116,5 +116,3 @@ ev_amzn = next((e for e in detail_amzn.events if e.is_rebal), None)
 owner_ms = ev_amzn.owner_from_name("MacKenzie Scott")
 oid_ms = owner_ms.owner_identity_id
 print(f"{owner_ms.name:35s}  shares={owner_ms.shares:>12,.2f}  components={len(owner_ms.components)}  delta={ev_amzn.owner_delta(oid_ms)}")
-
-pass
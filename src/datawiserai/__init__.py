@@ -1,6 +1,6 @@
 """Datawiser Python SDK — read-only access to the Datawiser API."""
 
-from .client import Client, ENDPOINTS
+from .client import AsyncClient, Client, ENDPOINTS
 from ._exceptions import DatawiserAPIError, DatawiserError, TickerNotFoundError
 from .models.free_float import FreeFloat, FreeFloatEvent
 from .models.free_float_events import (
@@ -20,6 +20,7 @@ from .models.shares_outstanding import SharesOutstanding, SharesOutstandingEvent
 from .models.universe import Universe, UniverseEntry
 
 __all__ = [
+    "AsyncClient",
     "Client",
     "CompanyInfo",
     "Component",
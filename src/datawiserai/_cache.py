@@ -1,44 +1,229 @@
 from __future__ import annotations
 
 import gzip
-import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Mapping, Optional, Tuple, Union
+
+from ._json import dumps, loads
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Level 3 is several times faster to write than gzip's default of 9 for a
+# few percent larger files.
+_GZIP_LEVEL = 3
+_ZSTD_LEVEL = 3
+
+# Suffixes in lookup order; new entries are written with the first one.
+# Legacy ``.json.gz`` files are still read when zstandard is installed.
+_SUFFIXES = (".json.zst", ".json.gz") if zstandard is not None else (".json.gz",)
+_ALL_SUFFIXES = (".json.zst", ".json.gz")
+
+# Errors raised by a truncated or corrupt cache file; any of them is a miss.
+# TypeError covers an entry whose JSON top level is not an object.
+_CORRUPT = (ValueError, KeyError, TypeError, OSError, EOFError, zlib.error)
+if zstandard is not None:
+    _CORRUPT += (zstandard.ZstdError,)
+
+
+def _compress(raw: bytes, suffix: str) -> bytes:
+    if suffix == ".json.zst":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+    return gzip.compress(raw, compresslevel=_GZIP_LEVEL)
+
+
+def _decompress(blob: bytes, suffix: str) -> bytes:
+    if suffix == ".json.zst":
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return gzip.decompress(blob)
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    """Write *blob* to *path* so readers never see a partial file.
+
+    The bytes go to a temporary file in the same directory which is then
+    renamed over *path*; a crash mid-write leaves only the stray temp file.
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# Seconds a manifest is reused when no per-endpoint value is given.
+DEFAULT_MANIFEST_TTL = 60.0
+
+# (data, last_update, etag)
+_Entry = Tuple[Optional[dict[str, Any]], Optional[str], Optional[str]]
+
+# (uncompressed entry JSON, last_update, etag)
+_Memo = Tuple[bytes, Optional[str], Optional[str]]
+
+# (last_update, etag)
+_Stamp = Tuple[Optional[str], Optional[str]]
+
+_INDEX_NAME = "index.jsonl"
+
+# Rewrite an index once it holds this many superseded lines.
+_INDEX_SLACK = 1024
 
 
 class FileCache:
-    """Simple file-based cache: one gzipped JSON file per (endpoint, ticker) pair.
+    """Simple file-based cache: one compressed JSON file per (endpoint, ticker) pair.
+
+    Files are zstd-compressed (``.json.zst``) when the optional
+    ``zstandard`` package is installed and gzipped (``.json.gz``)
+    otherwise.
 
     Layout::
 
         cache_dir/
           free-float/
-            OLP.json.gz        # {"last_update": "...", "cached_at": "...", "data": {...}}
+            index.jsonl        # one {"ticker", "last_update", "etag"} line per write
+            OLP.json.zst       # {"last_update": "...", "cached_at": "...", "etag": "...", "data": {...}}
           shares-outstanding/
-            OLP.json.gz
+            index.jsonl
+            OLP.json.zst
+
+    The per-endpoint index is read once and answers :meth:`stamp` for
+    every ticker, so freshness checks never open payload files.  It is
+    append-only (the last line for a ticker wins) and is rewritten when
+    it accumulates too many superseded lines.  Entries missing from the
+    index fall back to the stamp stored in the payload file itself.
+
+    The most recently used *memory_max* entries are also kept in memory,
+    already decompressed, so repeated reads of a hot ticker skip the file
+    read and decompression.  They are held as JSON bytes and decoded on
+    every read, so each caller gets its own copy of the payload and may
+    mutate it freely.  Set *memory_max* to ``0`` to disable this layer.
     """
 
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(self, cache_dir: Path, memory_max: int = 256) -> None:
         self._dir = cache_dir
         self._dir.mkdir(parents=True, exist_ok=True)
+        self._memory_max = memory_max
+        self._memory: OrderedDict[Tuple[str, str], _Memo] = OrderedDict()
+        # endpoint -> (ticker -> stamp, number of lines in the index file)
+        self._indexes: dict[str, Tuple[dict[str, _Stamp], int]] = {}
+        self._lock = threading.Lock()
 
-    def _path(self, endpoint: str, ticker: str) -> Path:
-        return self._dir / endpoint / f"{ticker}.json.gz"
+    def _path(self, endpoint: str, ticker: str, suffix: str = _SUFFIXES[0]) -> Path:
+        return self._dir / endpoint / f"{ticker}{suffix}"
 
-    def get(
-        self, endpoint: str, ticker: str
-    ) -> Tuple[Optional[dict[str, Any]], Optional[str]]:
-        """Return ``(cached_data, cached_last_update)`` or ``(None, None)``."""
-        path = self._path(endpoint, ticker)
-        if not path.exists():
-            return None, None
+    def _index(self, endpoint: str) -> dict[str, _Stamp]:
+        """Return the stamp index for *endpoint*.  Caller holds the lock."""
+        loaded = self._indexes.get(endpoint)
+        if loaded is not None:
+            return loaded[0]
+        index: dict[str, _Stamp] = {}
+        lines = 0
         try:
-            with gzip.open(path, "rt", encoding="utf-8") as f:
-                entry = json.load(f)
-            return entry["data"], entry["last_update"]
-        except (json.JSONDecodeError, KeyError, OSError):
-            return None, None
+            with open(self._dir / endpoint / _INDEX_NAME, "rb") as f:
+                for line in f:
+                    lines += 1
+                    if not line.endswith(b"\n"):
+                        # Torn by an interrupted append: rewrite on the next
+                        # write rather than appending onto the fragment.
+                        lines += _INDEX_SLACK
+                        continue
+                    try:
+                        rec = loads(line)
+                        index[rec["ticker"]] = (rec["last_update"], rec.get("etag"))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        self._indexes[endpoint] = (index, lines)
+        return index
+
+    def _record(
+        self, endpoint: str, ticker: str, last_update: str, etag: Optional[str]
+    ) -> None:
+        """Store a stamp in the index and persist it.  Caller holds the lock."""
+        index = self._index(endpoint)
+        lines = self._indexes[endpoint][1]
+        index[ticker] = (last_update, etag)
+        path = self._dir / endpoint / _INDEX_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if lines - len(index) >= _INDEX_SLACK:
+            _write_atomic(
+                path,
+                b"".join(
+                    dumps({"ticker": t, "last_update": ts, "etag": et}) + b"\n"
+                    for t, (ts, et) in index.items()
+                ),
+            )
+            lines = len(index)
+        else:
+            line = {"ticker": ticker, "last_update": last_update, "etag": etag}
+            with open(path, "ab") as f:
+                f.write(dumps(line) + b"\n")
+            lines += 1
+        self._indexes[endpoint] = (index, lines)
+
+    def stamp(self, endpoint: str, ticker: str) -> _Stamp:
+        """Return ``(cached_last_update, etag)`` without loading the payload.
+
+        Both are *None* when nothing is cached.
+        """
+        with self._lock:
+            hit = self._index(endpoint).get(ticker)
+        if hit is not None:
+            return hit
+        # Entries written before the index existed carry their own stamp.
+        _, last_update, etag = self.get(endpoint, ticker)
+        return last_update, etag
+
+    def get(self, endpoint: str, ticker: str) -> _Entry:
+        """Return ``(cached_data, cached_last_update, etag)``.
+
+        All three are *None* when nothing is cached.
+        """
+        key = (endpoint, ticker)
+        with self._lock:
+            memo = self._memory.get(key)
+            if memo is not None:
+                self._memory.move_to_end(key)
+            else:
+                indexed = self._index(endpoint).get(ticker)
+        if memo is not None:
+            blob, last_update, etag = memo
+            return loads(blob)["data"], last_update, etag
+        for suffix in _SUFFIXES:
+            path = self._path(endpoint, ticker, suffix)
+            if path.exists():
+                break
+        else:
+            return None, None, None
+        try:
+            blob = _decompress(path.read_bytes(), suffix)
+            entry = loads(blob)
+            hit = entry["data"], entry["last_update"], entry.get("etag")
+        except _CORRUPT:
+            return None, None, None
+        if indexed is not None:
+            # The index is newer than the payload after a touch().
+            hit = (hit[0], *indexed)
+        else:
+            with self._lock:
+                self._record(endpoint, ticker, hit[1], hit[2])
+        self._remember(key, (blob, *hit[1:]))
+        return hit
 
     def put(
         self,
@@ -46,17 +231,55 @@ class FileCache:
         ticker: str,
         data: dict[str, Any],
         last_update: str,
+        etag: Optional[str] = None,
     ) -> None:
-        """Write *data* to the cache with its manifest *last_update* stamp."""
+        """Write *data* to the cache with its manifest *last_update* stamp.
+
+        *etag* is the response's ``ETag`` header, if any, and is replayed as
+        ``If-None-Match`` once the entry goes stale.
+        """
         path = self._path(endpoint, ticker)
         path.parent.mkdir(parents=True, exist_ok=True)
         entry = {
             "last_update": last_update,
             "cached_at": datetime.now(timezone.utc).isoformat(),
+            "etag": etag,
             "data": data,
         }
-        with gzip.open(path, "wt", encoding="utf-8") as f:
-            json.dump(entry, f)
+        blob = dumps(entry)
+        _write_atomic(path, _compress(blob, _SUFFIXES[0]))
+        for legacy in _SUFFIXES[1:]:
+            self._path(endpoint, ticker, legacy).unlink(missing_ok=True)
+        with self._lock:
+            self._record(endpoint, ticker, last_update, etag)
+        self._remember((endpoint, ticker), (blob, last_update, etag))
+
+    def touch(
+        self,
+        endpoint: str,
+        ticker: str,
+        last_update: str,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Re-stamp an existing entry whose payload is unchanged.
+
+        Only the index is written; the payload file is left as is.
+        """
+        key = (endpoint, ticker)
+        with self._lock:
+            self._record(endpoint, ticker, last_update, etag)
+            memo = self._memory.get(key)
+            if memo is not None:
+                self._memory[key] = (memo[0], last_update, etag)
+
+    def _remember(self, key: Tuple[str, str], memo: _Memo) -> None:
+        if self._memory_max <= 0:
+            return
+        with self._lock:
+            self._memory[key] = memo
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_max:
+                self._memory.popitem(last=False)
 
     def clear(self, endpoint: str | None = None) -> int:
         """Delete cached files.  Returns the number of files removed.
@@ -64,14 +287,82 @@ class FileCache:
         If *endpoint* is given only that endpoint's cache is cleared;
         otherwise the entire cache is wiped.
         """
+        with self._lock:
+            if endpoint is None:
+                self._memory.clear()
+                self._indexes.clear()
+            else:
+                for key in [k for k in self._memory if k[0] == endpoint]:
+                    del self._memory[key]
+                self._indexes.pop(endpoint, None)
         root = self._dir / endpoint if endpoint else self._dir
         removed = 0
         if not root.exists():
             return removed
-        for p in root.rglob("*.json.gz"):
-            p.unlink()
-            removed += 1
+        for suffix in _ALL_SUFFIXES:
+            for p in root.rglob(f"*{suffix}"):
+                p.unlink()
+                removed += 1
+        # Indexes, and leftovers from writes interrupted before their rename.
+        for pattern in (_INDEX_NAME, ".*.tmp"):
+            for p in root.rglob(pattern):
+                p.unlink()
         for d in sorted(root.rglob("*"), reverse=True):
             if d.is_dir() and not any(d.iterdir()):
                 d.rmdir()
         return removed
+
+
+class ManifestCache:
+    """In-memory memo of endpoint manifests, each valid for *ttl* seconds.
+
+    Manifests are small and change rarely, so re-downloading one for every
+    ticker request is pure overhead.  *ttl* is either one value for every
+    endpoint or a mapping of endpoint to seconds; endpoints missing from
+    the mapping use :data:`DEFAULT_MANIFEST_TTL`.  A *ttl* of ``0``
+    disables caching.
+
+    Tickers found missing from a manifest are remembered for the same
+    *ttl*, so repeated lookups fail fast even after the manifest itself
+    has expired.  Storing a new manifest forgets that endpoint's misses.
+    """
+
+    def __init__(self, ttl: Union[float, Mapping[str, float]]) -> None:
+        self._ttl = ttl
+        self._entries: dict[str, Tuple[float, dict[str, Any]]] = {}
+        self._missing: dict[str, dict[str, float]] = {}
+
+    def _ttl_for(self, endpoint: str) -> float:
+        if isinstance(self._ttl, Mapping):
+            return self._ttl.get(endpoint, DEFAULT_MANIFEST_TTL)
+        return self._ttl
+
+    def get(self, endpoint: str) -> Optional[dict[str, Any]]:
+        """Return the cached manifest for *endpoint* or *None* if expired."""
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return None
+        fetched_at, manifest = entry
+        if time.monotonic() - fetched_at >= self._ttl_for(endpoint):
+            return None
+        return manifest
+
+    def put(self, endpoint: str, manifest: dict[str, Any]) -> None:
+        self._missing.pop(endpoint, None)
+        if self._ttl_for(endpoint) > 0:
+            self._entries[endpoint] = (time.monotonic(), manifest)
+
+    def is_missing(self, endpoint: str, ticker: str) -> bool:
+        """Return *True* if *ticker* was recently absent from *endpoint*."""
+        missed_at = self._missing.get(endpoint, {}).get(ticker)
+        if missed_at is None:
+            return False
+        return time.monotonic() - missed_at < self._ttl_for(endpoint)
+
+    def put_missing(self, endpoint: str, ticker: str) -> None:
+        if self._ttl_for(endpoint) > 0:
+            self._missing.setdefault(endpoint, {})[ticker] = time.monotonic()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._missing.clear()
@@ -0,0 +1,25 @@
+"""JSON encoding shared by the transports and the on-disk cache.
+
+:mod:`orjson` is used when installed (``pip install 'datawiserai[fast]'``);
+it decodes several times faster than the standard library, which matters
+for the larger free-float payloads.  Both functions work on UTF-8 bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ._exceptions import DatawiserAPIError
+from ._json import loads
 
 BASE_URL = "https://api.datawiser.ai/v1"
 
 
 class Transport:
-    """Fetch data from the Datawiser API over HTTPS."""
+    """Fetch data from the Datawiser API over HTTPS.
 
-    def __init__(self, api_key: str) -> None:
+    A single :class:`requests.Session` keeps connections alive across
+    calls.  Its pool is sized for multi-threaded use (*pool_maxsize*
+    connections per host) and transient failures (429 / 5xx) are retried
+    with exponential backoff.
+    """
+
+    def __init__(self, api_key: str, *, pool_maxsize: int = 64) -> None:
         self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update(
             {
                 "X-API-Key": api_key,
@@ -21,16 +42,58 @@ class Transport:
             }
         )
 
-    def _request(self, url: str) -> dict[str, Any]:
-        resp = self._session.get(url, timeout=30)
+    def _request(
+        self, url: str, headers: Optional[dict[str, str]] = None
+    ) -> requests.Response:
+        resp = self._session.get(url, headers=headers, timeout=30)
         if not resp.ok:
             raise DatawiserAPIError(resp.status_code, resp.text)
-        return resp.json()
+        return resp
 
     def get_manifest(self, endpoint: str) -> dict[str, Any]:
         """Return the folder manifest (last_update per ticker) for *endpoint*."""
-        return self._request(f"{BASE_URL}/manifest/{endpoint}/updates")
+        resp = self._request(f"{BASE_URL}/manifest/{endpoint}/updates")
+        return loads(resp.content)
+
+    def get(
+        self, endpoint: str, ticker: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[dict[str, Any]], Optional[str]]:
+        """Return ``(payload, etag)`` for a single *ticker* under *endpoint*.
+
+        If *etag* is given and the resource is unchanged the server replies
+        ``304 Not Modified``; the payload is then *None*.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        resp = self._request(f"{BASE_URL}/{endpoint}/{ticker}", headers)
+        if resp.status_code == 304:
+            return None, resp.headers.get("ETag", etag)
+        return loads(resp.content), resp.headers.get("ETag")
+
+    def stream(
+        self, endpoint: str, ticker: str, prefix: str = "events.item"
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items under *prefix* of a payload as they are received.
+
+        Uses the optional :mod:`ijson` parser so the full response never has
+        to be held in memory at once.
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError(
+                "ijson is required for stream=True. "
+                "Install it with:  pip install 'datawiserai[stream]'"
+            ) from None
+
+        resp = self._session.get(
+            f"{BASE_URL}/{endpoint}/{ticker}", stream=True, timeout=30
+        )
+        if not resp.ok:
+            raise DatawiserAPIError(resp.status_code, resp.text)
+        resp.raw.decode_content = True
+        return _iter_items(ijson, resp, prefix)
+
 
-    def get(self, endpoint: str, ticker: str) -> dict[str, Any]:
-        """Return the JSON payload for a single *ticker* under *endpoint*."""
-        return self._request(f"{BASE_URL}/{endpoint}/{ticker}")
+def _iter_items(ijson, resp: requests.Response, prefix: str) -> Iterator[Any]:
+    with resp:
+        yield from ijson.items(resp.raw, prefix, use_float=True)
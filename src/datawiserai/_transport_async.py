@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Any, Optional, Tuple
+
+from ._exceptions import DatawiserAPIError
+from ._json import loads
+from ._transport import BASE_URL
+
+
+class AsyncTransport:
+    """Fetch data from the Datawiser API over HTTPS with :mod:`httpx`.
+
+    HTTP/2 is negotiated when the optional ``h2`` package is installed, so
+    concurrent requests share a single TLS connection.
+    """
+
+    def __init__(self, api_key: str, *, max_connections: int = 32) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for AsyncClient. "
+                "Install it with:  pip install 'datawiserai[async]'"
+            ) from None
+
+        self._client = httpx.AsyncClient(
+            http2=find_spec("h2") is not None,
+            headers={
+                "X-API-Key": api_key,
+                "Accept": "application/json",
+            },
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def _request(self, url: str, headers: Optional[dict[str, str]] = None):
+        resp = await self._client.get(url, headers=headers)
+        if resp.status_code == 304:
+            return resp
+        if not resp.is_success:
+            raise DatawiserAPIError(resp.status_code, resp.text)
+        return resp
+
+    async def get_manifest(self, endpoint: str) -> dict[str, Any]:
+        """Return the folder manifest (last_update per ticker) for *endpoint*."""
+        resp = await self._request(f"{BASE_URL}/manifest/{endpoint}/updates")
+        return loads(resp.content)
+
+    async def get(
+        self, endpoint: str, ticker: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[dict[str, Any]], Optional[str]]:
+        """Return ``(payload, etag)`` for a single *ticker* under *endpoint*.
+
+        See :meth:`Transport.get`.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        resp = await self._request(f"{BASE_URL}/{endpoint}/{ticker}", headers)
+        if resp.status_code == 304:
+            return None, resp.headers.get("ETag", etag)
+        return loads(resp.content), resp.headers.get("ETag")
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Iterable, Iterator, Mapping, Union
 
-from ._cache import FileCache
+from ._cache import FileCache, ManifestCache
 from ._exceptions import TickerNotFoundError
 from ._transport import Transport
+from ._transport_async import AsyncTransport
 from .models.free_float import FreeFloat
 from .models.free_float_events import FreeFloatEvents, FreeFloatEventsDetail
 from .models.reference import Reference
@@ -26,12 +30,40 @@ ENDPOINTS = (
 
 _ALIAS = {ep.replace("-", "_"): ep for ep in ENDPOINTS}
 
+_PARSERS: dict[str, Callable[[dict], Any]] = {
+    "free-float": FreeFloat._from_dict,
+    "free-float-events": FreeFloatEvents._from_dict,
+    "shares-outstanding": SharesOutstanding._from_dict,
+    "reference": Reference._from_dict,
+}
 
+
+@lru_cache(maxsize=None)
 def _resolve_endpoint(name: str) -> str:
     """Accept both ``'free-float'`` and ``'free_float'``."""
     return _ALIAS.get(name, name)
 
 
+def _parser(endpoint: str) -> Callable[[dict], Any]:
+    """Return the model parser for a resolved *endpoint*."""
+    try:
+        return _PARSERS[endpoint]
+    except KeyError:
+        raise ValueError(
+            f"Unknown endpoint {endpoint!r}; expected one of "
+            + ", ".join(map(repr, ENDPOINTS))
+        ) from None
+
+
+def _resolve_ttl(
+    ttl: Union[float, Mapping[str, float]]
+) -> Union[float, Mapping[str, float]]:
+    """Normalise the endpoint keys of a per-endpoint *ttl* mapping."""
+    if isinstance(ttl, Mapping):
+        return {_resolve_endpoint(ep): seconds for ep, seconds in ttl.items()}
+    return ttl
+
+
 class Client:
     """Entry-point for the Datawiser Python SDK.
 
@@ -44,6 +76,19 @@ class Client:
         ``~/.datawiserai/cache``.
     use_cache : bool
         Set to *False* to bypass the local cache entirely.
+    cache_memory_max : int
+        Number of decompressed responses kept in memory on top of the
+        on-disk cache, so repeated requests for the same ticker skip the
+        file read and decompression.  Payloads are not shared: each call
+        decodes its own copy, so mutating one (e.g. ``Reference.raw``)
+        does not affect later results.  Set to ``0`` to disable.
+    manifest_ttl : float or dict
+        Seconds for which an endpoint manifest is reused before being
+        downloaded again, either one value for all endpoints or a mapping
+        such as ``{"reference": 3600}`` (other endpoints keep the 60s
+        default).  Tickers missing from a manifest are remembered for as
+        long, so repeated misses do not re-download it.  Set to ``0`` to
+        fetch it on every call.
     """
 
     def __init__(
@@ -52,47 +97,84 @@ class Client:
         *,
         cache_dir: Union[str, Path, None] = None,
         use_cache: bool = True,
+        cache_memory_max: int = 256,
+        manifest_ttl: Union[float, Mapping[str, float]] = 60.0,
     ) -> None:
         self._api_key = api_key
         self._transport = Transport(api_key)
         self._use_cache = use_cache
         self._cache = FileCache(
-            Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR
+            Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR,
+            memory_max=cache_memory_max,
         )
+        self._manifests = ManifestCache(_resolve_ttl(manifest_ttl))
+        # endpoint -> (manifest, Universe); reused while the manifest cache
+        # keeps handing back the same manifest object.
+        self._universes: dict[str, tuple[dict, Universe]] = {}
 
     # ------------------------------------------------------------------
     # internal helpers
     # ------------------------------------------------------------------
 
     def _get_manifest(self, endpoint: str) -> dict:
-        return self._transport.get_manifest(endpoint)
-
-    def _fetch(self, endpoint: str, ticker: str) -> dict:
-        """Return parsed JSON for *ticker*, using the cache when fresh."""
-        manifest = self._get_manifest(endpoint)
-
-        entry = manifest.get(ticker)
+        manifest = self._manifests.get(endpoint)
+        if manifest is None:
+            manifest = self._transport.get_manifest(endpoint)
+            self._manifests.put(endpoint, manifest)
+        return manifest
+
+    def _manifest_entry(self, endpoint: str, ticker: str) -> dict:
+        if self._manifests.is_missing(endpoint, ticker):
+            raise TickerNotFoundError(ticker, endpoint)
+        entry = self._get_manifest(endpoint).get(ticker)
         if entry is None:
+            self._manifests.put_missing(endpoint, ticker)
             raise TickerNotFoundError(ticker, endpoint)
+        return entry
 
-        remote_ts = entry["last_update"]
-
-        if self._use_cache:
-            cached_data, cached_ts = self._cache.get(endpoint, ticker)
-            if cached_data is not None and cached_ts == remote_ts:
+    def _fetch(self, endpoint: str, ticker: str) -> dict:
+        """Return parsed JSON for *ticker*, using the cache when fresh."""
+        remote_ts = self._manifest_entry(endpoint, ticker)["last_update"]
+        cache = self._cache if self._use_cache else None
+        transport_get = self._transport.get
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        cached_etag = None
+        if cache is not None:
+            cached_ts, cached_etag = cache.stamp(endpoint, ticker)
+            if cached_ts == remote_ts:
+                cached_data = cache.get(endpoint, ticker)[0]
+                if cached_data is not None:
+                    if debug:
+                        logger.debug(
+                            "cache hit for %s/%s (last_update=%s)",
+                            endpoint,
+                            ticker,
+                            remote_ts,
+                        )
+                    return cached_data
+
+        # A stale entry still carries its ETag: if the body has not changed
+        # the server answers 304 and only the stamp needs refreshing.
+        data, etag = transport_get(endpoint, ticker, etag=cached_etag)
+        if data is None:
+            data = cache.get(endpoint, ticker)[0] if cache is not None else None
+            if data is not None:
+                if debug:
+                    logger.debug(
+                        "not modified %s/%s (etag=%s)", endpoint, ticker, etag
+                    )
+                cache.touch(endpoint, ticker, remote_ts, etag)
+                return data
+            # The payload vanished since its stamp was read.
+            data, etag = transport_get(endpoint, ticker)
+
+        if cache is not None:
+            cache.put(endpoint, ticker, data, remote_ts, etag=etag)
+            if debug:
                 logger.debug(
-                    "cache hit for %s/%s (last_update=%s)",
-                    endpoint,
-                    ticker,
-                    remote_ts,
+                    "cached %s/%s (last_update=%s)", endpoint, ticker, remote_ts
                 )
-                return cached_data
-
-        data = self._transport.get(endpoint, ticker)
-
-        if self._use_cache:
-            self._cache.put(endpoint, ticker, data, remote_ts)
-            logger.debug("cached %s/%s (last_update=%s)", endpoint, ticker, remote_ts)
 
         return data
 
@@ -118,7 +200,12 @@ class Client:
         """
         endpoint = _resolve_endpoint(endpoint)
         manifest = self._get_manifest(endpoint)
-        return Universe._from_manifest(endpoint, manifest)
+        cached = self._universes.get(endpoint)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+        universe = Universe._from_manifest(endpoint, manifest)
+        self._universes[endpoint] = (manifest, universe)
+        return universe
 
     # ------------------------------------------------------------------
     # endpoint methods
@@ -134,22 +221,50 @@ class Client:
         data = self._fetch("free-float", ticker)
         return FreeFloat._from_dict(data)
 
-    def free_float_events(self, ticker: str) -> FreeFloatEvents:
+    def free_float_events(
+        self, ticker: str, *, stream: bool = False
+    ) -> FreeFloatEvents:
         """Fetch free-float events (flat/summary view) for *ticker*.
 
         Each owner-date pair is flattened into a
         :class:`~datawiserai.models.FreeFloatOwnerSummary`.  Nested
         structures (sub-components, restrictions, options, event details)
         are omitted.  Call ``.to_dataframe()`` for a pandas DataFrame.
+
+        With ``stream=True`` a stale or missing payload is parsed
+        incrementally as it downloads (requires the optional ``ijson``
+        package), which keeps peak memory low for very large tickers.
+        Streamed payloads are not written to the cache.
         """
+        if stream:
+            return self._stream_free_float_events(ticker)
         data = self._fetch("free-float-events", ticker)
         return FreeFloatEvents._from_dict(data)
 
-    def free_float_events_detail(self, ticker: str) -> FreeFloatEventsDetail:
+    def _stream_free_float_events(self, ticker: str) -> FreeFloatEvents:
+        endpoint = "free-float-events"
+        entry = self._manifest_entry(endpoint, ticker)
+        if (
+            self._use_cache
+            and self._cache.stamp(endpoint, ticker)[0] == entry["last_update"]
+        ):
+            cached_data = self._cache.get(endpoint, ticker)[0]
+            if cached_data is not None:
+                return FreeFloatEvents._from_dict(cached_data)
+        events = self._transport.stream(endpoint, ticker)
+        return FreeFloatEvents._from_events(
+            ticker, entry.get("security_id", ""), events
+        )
+
+    def free_float_events_detail(
+        self, ticker: str, *, keep_raw: bool = True
+    ) -> FreeFloatEventsDetail:
         """Fetch free-float events (full drill-down) for *ticker*.
 
         Returns the complete nested ownership structure.  Use this for
-        interactive exploration rather than tabular analysis::
+        interactive exploration rather than tabular analysis.  Pass
+        ``keep_raw=False`` to leave each event's ``raw`` dict as None, which
+        lets the parsed payload be freed when the typed fields are enough::
 
             detail = client.free_float_events_detail("OLP")
             ev = detail[0]                          # first event date
@@ -160,7 +275,7 @@ class Client:
             owner["eventDetails"]                   # event details
         """
         data = self._fetch("free-float-events", ticker)
-        return FreeFloatEventsDetail._from_dict(data)
+        return FreeFloatEventsDetail._from_dict(data, keep_raw)
 
     def shares_outstanding(self, ticker: str) -> SharesOutstanding:
         """Fetch shares-outstanding data for *ticker*.
@@ -180,6 +295,94 @@ class Client:
         data = self._fetch("reference", ticker)
         return Reference._from_dict(data)
 
+    # ------------------------------------------------------------------
+    # batch helpers
+    # ------------------------------------------------------------------
+
+    def prefetch(
+        self, endpoint: str, tickers: Iterable[str], *, workers: int = 16
+    ) -> None:
+        """Warm the local cache for many *tickers* in parallel.
+
+        The endpoint manifest is downloaded once; payloads that are missing
+        or stale in the cache are then fetched on *workers* threads.
+        Tickers absent from the manifest are skipped.  Does nothing when
+        the client was created with ``use_cache=False``.
+        """
+        if not self._use_cache:
+            return
+        endpoint = _resolve_endpoint(endpoint)
+        manifest = self._get_manifest(endpoint)
+        wanted = [t for t in tickers if t in manifest]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(lambda t: self._fetch(endpoint, t), wanted):
+                pass
+
+    def batch(
+        self, requests: Iterable[tuple[str, str]], *, workers: int = 16
+    ) -> list:
+        """Fetch many ``(endpoint, ticker)`` pairs in parallel.
+
+        Returns the parsed model for each pair, in input order — the same
+        object the matching single-ticker method would return (e.g.
+        :class:`~datawiserai.models.FreeFloat` for ``"free-float"``)::
+
+            ff, so = client.batch([("free-float", "OLP"),
+                                   ("shares-outstanding", "OLP")])
+
+        Each endpoint manifest is downloaded at most once.  Raises
+        :class:`ValueError` for an unknown endpoint before anything is
+        fetched.
+        """
+        pairs = [(_resolve_endpoint(ep), t) for ep, t in requests]
+        parsers = {ep: _parser(ep) for ep, _ in pairs}
+        for endpoint in parsers:
+            self._get_manifest(endpoint)
+
+        def load(pair: tuple[str, str]):
+            endpoint, ticker = pair
+            return parsers[endpoint](self._fetch(endpoint, ticker))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(load, pairs))
+
+    def map(
+        self, endpoint: str, tickers: Iterable[str], *, workers: int = 16
+    ) -> Iterator[tuple[str, Any]]:
+        """Yield ``(ticker, model)`` for each of *tickers*, fetched in parallel.
+
+        Requests run on *workers* threads sharing the client's connection
+        pool, and results are yielded in input order as soon as each one
+        is ready::
+
+            for ticker, ff in client.map("free-float", ["OLP", "TSLA"]):
+                print(ticker, ff.latest())
+
+        Keep *workers* within your API rate limit; the pool holds 64
+        connections, so larger values gain nothing.  An unknown *endpoint*
+        raises :class:`ValueError` immediately; a ticker missing from the
+        manifest raises :class:`TickerNotFoundError` when its result is
+        reached.
+        """
+        endpoint = _resolve_endpoint(endpoint)
+        return self._map(endpoint, _parser(endpoint), tickers, workers)
+
+    def _map(
+        self,
+        endpoint: str,
+        parse: Callable[[dict], Any],
+        tickers: Iterable[str],
+        workers: int,
+    ) -> Iterator[tuple[str, Any]]:
+        tickers = list(tickers)
+        self._get_manifest(endpoint)
+
+        def load(ticker: str):
+            return parse(self._fetch(endpoint, ticker))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from zip(tickers, pool.map(load, tickers))
+
     # ------------------------------------------------------------------
     # cache management
     # ------------------------------------------------------------------
@@ -196,3 +399,250 @@ class Client:
         if endpoint is not None:
             endpoint = _resolve_endpoint(endpoint)
         return self._cache.clear(endpoint)
+
+
+class AsyncClient:
+    """Asynchronous entry-point for the Datawiser Python SDK.
+
+    Mirrors :class:`Client` with ``async`` methods, so many tickers can be
+    fetched concurrently instead of one round-trip at a time::
+
+        async with dw.AsyncClient(api_key="pk_live_...") as client:
+            ffs = await client.batch_free_float(["OLP", "TSLA", "AMZN"])
+
+    Requires the optional ``httpx`` dependency
+    (``pip install 'datawiserai[async]'``).
+
+    Parameters
+    ----------
+    api_key : str
+        Your Datawiser API key.
+    cache_dir : str or Path, optional
+        Where to store cached responses.  Defaults to
+        ``~/.datawiserai/cache``.
+    use_cache : bool
+        Set to *False* to bypass the local cache entirely.
+    cache_memory_max : int
+        Number of decompressed responses kept in memory on top of the
+        on-disk cache, so repeated requests for the same ticker skip the
+        file read and decompression.  Payloads are not shared: each call
+        decodes its own copy, so mutating one (e.g. ``Reference.raw``)
+        does not affect later results.  Set to ``0`` to disable.
+    manifest_ttl : float or dict
+        Seconds for which an endpoint manifest is reused before being
+        downloaded again, either one value for all endpoints or a mapping
+        such as ``{"reference": 3600}`` (other endpoints keep the 60s
+        default).  Tickers missing from a manifest are remembered for as
+        long, so repeated misses do not re-download it.  Set to ``0`` to
+        fetch it on every call.
+    max_concurrency : int
+        Upper bound on in-flight requests issued by :meth:`fetch_many`
+        and the ``batch_*`` helpers.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        cache_dir: Union[str, Path, None] = None,
+        use_cache: bool = True,
+        cache_memory_max: int = 256,
+        manifest_ttl: Union[float, Mapping[str, float]] = 60.0,
+        max_concurrency: int = 16,
+    ) -> None:
+        self._api_key = api_key
+        self._transport = AsyncTransport(
+            api_key, max_connections=max(32, max_concurrency)
+        )
+        self._use_cache = use_cache
+        self._max_concurrency = max_concurrency
+        self._cache = FileCache(
+            Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR,
+            memory_max=cache_memory_max,
+        )
+        self._manifests = ManifestCache(_resolve_ttl(manifest_ttl))
+        # endpoint -> (manifest, Universe); reused while the manifest cache
+        # keeps handing back the same manifest object.
+        self._universes: dict[str, tuple[dict, Universe]] = {}
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._transport.aclose()
+
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
+
+    async def _get_manifest(self, endpoint: str) -> dict:
+        manifest = self._manifests.get(endpoint)
+        if manifest is None:
+            manifest = await self._transport.get_manifest(endpoint)
+            self._manifests.put(endpoint, manifest)
+        return manifest
+
+    async def _fetch(
+        self, endpoint: str, ticker: str, manifest: dict | None = None
+    ) -> dict:
+        """Return parsed JSON for *ticker*, using the cache when fresh.
+
+        Disk I/O for the cache runs in a worker thread so it never blocks
+        the event loop.
+        """
+        if manifest is None:
+            if self._manifests.is_missing(endpoint, ticker):
+                raise TickerNotFoundError(ticker, endpoint)
+            manifest = await self._get_manifest(endpoint)
+
+        entry = manifest.get(ticker)
+        if entry is None:
+            self._manifests.put_missing(endpoint, ticker)
+            raise TickerNotFoundError(ticker, endpoint)
+
+        remote_ts = entry["last_update"]
+
+        cached_etag = None
+        if self._use_cache:
+            cached_ts, cached_etag = await asyncio.to_thread(
+                self._cache.stamp, endpoint, ticker
+            )
+            if cached_ts == remote_ts:
+                cached_data = (
+                    await asyncio.to_thread(self._cache.get, endpoint, ticker)
+                )[0]
+                if cached_data is not None:
+                    logger.debug(
+                        "cache hit for %s/%s (last_update=%s)",
+                        endpoint,
+                        ticker,
+                        remote_ts,
+                    )
+                    return cached_data
+
+        data, etag = await self._transport.get(endpoint, ticker, etag=cached_etag)
+        if data is None:
+            data = (await asyncio.to_thread(self._cache.get, endpoint, ticker))[0]
+            if data is not None:
+                logger.debug("not modified %s/%s (etag=%s)", endpoint, ticker, etag)
+                await asyncio.to_thread(
+                    self._cache.touch, endpoint, ticker, remote_ts, etag
+                )
+                return data
+            data, etag = await self._transport.get(endpoint, ticker)
+
+        if self._use_cache:
+            await asyncio.to_thread(
+                self._cache.put, endpoint, ticker, data, remote_ts, etag
+            )
+            logger.debug("cached %s/%s (last_update=%s)", endpoint, ticker, remote_ts)
+
+        return data
+
+    async def fetch_many(
+        self, endpoint: str, tickers: Iterable[str]
+    ) -> list[dict]:
+        """Fetch the raw JSON payloads for many *tickers* concurrently.
+
+        The endpoint manifest is downloaded once and shared by every
+        request; at most ``max_concurrency`` payload requests are in flight
+        at any time.  Results are returned in the order of *tickers*.
+        """
+        endpoint = _resolve_endpoint(endpoint)
+        manifest = await self._get_manifest(endpoint)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_one(ticker: str) -> dict:
+            async with semaphore:
+                return await self._fetch(endpoint, ticker, manifest)
+
+        return await asyncio.gather(*(fetch_one(t) for t in tickers))
+
+    # ------------------------------------------------------------------
+    # universe
+    # ------------------------------------------------------------------
+
+    async def universe(self, endpoint: str) -> Universe:
+        """Return the set of available tickers for *endpoint*.
+
+        See :meth:`Client.universe`.
+        """
+        endpoint = _resolve_endpoint(endpoint)
+        manifest = await self._get_manifest(endpoint)
+        cached = self._universes.get(endpoint)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+        universe = Universe._from_manifest(endpoint, manifest)
+        self._universes[endpoint] = (manifest, universe)
+        return universe
+
+    # ------------------------------------------------------------------
+    # endpoint methods
+    # ------------------------------------------------------------------
+
+    async def free_float(self, ticker: str) -> FreeFloat:
+        """Fetch free-float data for *ticker*.  See :meth:`Client.free_float`."""
+        data = await self._fetch("free-float", ticker)
+        return FreeFloat._from_dict(data)
+
+    async def free_float_events(self, ticker: str) -> FreeFloatEvents:
+        """Fetch free-float events (flat/summary view) for *ticker*.
+
+        See :meth:`Client.free_float_events`.
+        """
+        data = await self._fetch("free-float-events", ticker)
+        return FreeFloatEvents._from_dict(data)
+
+    async def free_float_events_detail(
+        self, ticker: str, *, keep_raw: bool = True
+    ) -> FreeFloatEventsDetail:
+        """Fetch free-float events (full drill-down) for *ticker*.
+
+        See :meth:`Client.free_float_events_detail`.
+        """
+        data = await self._fetch("free-float-events", ticker)
+        return FreeFloatEventsDetail._from_dict(data, keep_raw)
+
+    async def shares_outstanding(self, ticker: str) -> SharesOutstanding:
+        """Fetch shares-outstanding data for *ticker*.
+
+        See :meth:`Client.shares_outstanding`.
+        """
+        data = await self._fetch("shares-outstanding", ticker)
+        return SharesOutstanding._from_dict(data)
+
+    async def reference(self, ticker: str) -> Reference:
+        """Fetch reference / identifier data for *ticker*.
+
+        See :meth:`Client.reference`.
+        """
+        data = await self._fetch("reference", ticker)
+        return Reference._from_dict(data)
+
+    # ------------------------------------------------------------------
+    # batch helpers
+    # ------------------------------------------------------------------
+
+    async def batch_free_float(self, tickers: Iterable[str]) -> list[FreeFloat]:
+        """Fetch free-float data for many *tickers* concurrently.
+
+        Returns one :class:`~datawiserai.models.FreeFloat` per ticker, in
+        the order given.  Raises :class:`TickerNotFoundError` if any ticker
+        is missing from the manifest.
+        """
+        data = await self.fetch_many("free-float", tickers)
+        return [FreeFloat._from_dict(d) for d in data]
+
+    # ------------------------------------------------------------------
+    # cache management
+    # ------------------------------------------------------------------
+
+    def clear_cache(self, endpoint: str | None = None) -> int:
+        """Remove cached data.  See :meth:`Client.clear_cache`."""
+        if endpoint is not None:
+            endpoint = _resolve_endpoint(endpoint)
+        return self._cache.clear(endpoint)
@@ -0,0 +1,84 @@
+"""Deferred access to the optional pandas dependency."""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any, Mapping, Optional, Sequence
+
+_pd: Optional[ModuleType] = None
+# pyarrow module once probed; False when it is not installed.
+_pa: Any = None
+
+
+def require_pandas(method: str) -> ModuleType:
+    """Return the :mod:`pandas` module, importing it on first use.
+
+    pandas is only needed by the ``to_*dataframe()`` methods, so it is not
+    imported with the package; once loaded the module is reused by every
+    later call.  Raises :class:`ImportError` naming *method* when pandas is
+    not installed.
+    """
+    global _pd
+    if _pd is None:
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError(
+                f"pandas is required for {method}(). "
+                "Install it with:  pip install 'datawiserai[pandas]'"
+            ) from None
+        _pd = pandas
+    return _pd
+
+
+def frame_from_columns(pd: ModuleType, columns: Mapping[str, Any]):
+    """Build a DataFrame from equal-length column sequences.
+
+    When the optional :mod:`pyarrow` package is installed (it comes with
+    the ``fast`` extra) the columns go through an Arrow table, whose
+    builders type each column in one C pass.
+    Columns Arrow cannot type (mixed or oversized values) fall back to the
+    plain :class:`pandas.DataFrame` constructor, as does a missing pyarrow.
+    """
+    global _pa
+    if _pa is None:
+        try:
+            import pyarrow
+        except ImportError:
+            pyarrow = False
+        _pa = pyarrow
+    if _pa:
+        try:
+            return _pa.Table.from_pydict(dict(columns)).to_pandas()
+        except (_pa.ArrowException, OverflowError):
+            pass
+    return pd.DataFrame(columns)
+
+
+def categorical_column(pd: ModuleType, values: Sequence[Any]):
+    """Return *values* as a :class:`pandas.Categorical` built from codes.
+
+    Categories keep first-seen order and ``None`` becomes a missing value;
+    building the codes here spares pandas a second hashing pass.
+    """
+    import numpy as np  # always available alongside pandas
+
+    cats: dict[Any, int] = {None: -1}
+    codes = np.fromiter(
+        (cats.setdefault(v, len(cats) - 1) for v in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    del cats[None]
+    return pd.Categorical.from_codes(codes, categories=list(cats))
+
+
+def empty_frame(pd: ModuleType, schema: Mapping[str, Any]):
+    """Return an empty DataFrame with the columns and dtypes in *schema*.
+
+    ``str`` columns get pandas' default string dtype (``object`` before
+    pandas 3), matching what inference gives a non-empty frame.
+    """
+    return pd.DataFrame(
+        {name: pd.Series(dtype=dtype) for name, dtype in schema.items()}
+    )
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from functools import cached_property
+from operator import itemgetter
 from typing import Any, Sequence
 
+from ._pandas import require_pandas
 
-@dataclass(frozen=True)
+
+_fromisoformat = date.fromisoformat
+
+
+def _as_of_key(e: dict[str, Any]) -> str:
+    return e["asOf"]
+
+
+# Fetches every FreeFloatEvent field from a raw event in one C-level call.
+_EVENT_FIELDS = itemgetter(
+    "asOf", "freeFloatFactor", "freeFloatPct", "sharesOutstanding", "excludedShares"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class FreeFloatEvent:
     """A single point-in-time free-float observation."""
 
@@ -17,12 +34,20 @@ class FreeFloatEvent:
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> FreeFloatEvent:
-        return cls(
-            as_of=date.fromisoformat(d["asOf"]),
-            free_float_factor=d["freeFloatFactor"],
-            free_float_pct=d["freeFloatPct"],
-            shares_outstanding=d["sharesOutstanding"],
-            excluded_shares=d["excludedShares"],
+        as_of, factor, pct, shares, excluded = _EVENT_FIELDS(d)
+        return cls(_fromisoformat(as_of), factor, pct, shares, excluded)
+
+    @classmethod
+    def _from_list(
+        cls, events: Sequence[dict[str, Any]]
+    ) -> tuple[FreeFloatEvent, ...]:
+        fromisoformat = _fromisoformat
+        rows = map(_EVENT_FIELDS, events)
+        return tuple(
+            [
+                cls(fromisoformat(as_of), factor, pct, shares, excluded)
+                for as_of, factor, pct, shares, excluded in rows
+            ]
         )
 
 
@@ -42,16 +67,28 @@ class FreeFloat:
 
     ticker: str
     security_id: str
-    events: tuple[FreeFloatEvent, ...]
+    _raw_events: tuple[dict[str, Any], ...] = field(repr=False, hash=False)
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> FreeFloat:
         return cls(
             ticker=d["ticker"],
             security_id=d["securityId"],
-            events=tuple(FreeFloatEvent._from_dict(e) for e in d["events"]),
+            _raw_events=tuple(d["events"]),
         )
 
+    @cached_property
+    def _sorted_events(self) -> tuple[dict[str, Any], ...]:
+        # Raw events most-recent first, for latest() and sorted frames.  The
+        # API already sends this order, so the stable sort is one linear
+        # pass and events sharing a date keep their API order.
+        return tuple(sorted(self._raw_events, key=_as_of_key, reverse=True))
+
+    @cached_property
+    def events(self) -> tuple[FreeFloatEvent, ...]:
+        """Parsed events, built from the raw payload on first access."""
+        return FreeFloatEvent._from_list(self._raw_events)
+
     def to_dataframe(self, sort: bool = True):
         """Convert to a :class:`pandas.DataFrame`.
 
@@ -59,45 +96,46 @@ class FreeFloat:
         ----------
         sort : bool
             If *True* (default) rows are sorted descending by date
-            (most recent first), matching the API order.
+            (most recent first); otherwise they keep the API order of
+            :attr:`events`.
 
         Returns
         -------
         pandas.DataFrame
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                "pandas is required for to_dataframe(). "
-                "Install it with:  pip install 'datawiserai[pandas]'"
-            ) from None
-
-        rows = [
+        pd = require_pandas("to_dataframe")
+
+        import numpy as np  # always available alongside pandas
+
+        # Fill one typed array per column straight from the raw payload, so
+        # no FreeFloatEvent objects are created just to be taken apart
+        # again.  numpy parses the ISO dates itself.
+        raw = self._sorted_events if sort else self._raw_events
+        n = len(raw)
+
+        def column(key: str):
+            return np.fromiter((e[key] for e in raw), dtype=np.float64, count=n)
+
+        as_of = np.array([e["asOf"] for e in raw], dtype="datetime64[D]")
+        return pd.DataFrame(
             {
-                "as_of": e.as_of,
-                "free_float_factor": e.free_float_factor,
-                "free_float_pct": e.free_float_pct,
-                "shares_outstanding": e.shares_outstanding,
-                "excluded_shares": e.excluded_shares,
-            }
-            for e in self.events
-        ]
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["as_of"] = pd.to_datetime(df["as_of"])
-            if sort:
-                df = df.sort_values("as_of", ascending=False).reset_index(drop=True)
-        return df
+                "as_of": as_of.astype("datetime64[ns]"),
+                "free_float_factor": column("freeFloatFactor"),
+                "free_float_pct": column("freeFloatPct"),
+                "shares_outstanding": column("sharesOutstanding"),
+                "excluded_shares": column("excludedShares"),
+            },
+            copy=False,
+        )
 
     def latest(self) -> FreeFloatEvent | None:
         """Return the most-recent event, or *None* if there are no events."""
-        if not self.events:
+        if not self._raw_events:
             return None
-        return max(self.events, key=lambda e: e.as_of)
+        return FreeFloatEvent._from_dict(self._sorted_events[0])
 
     def __len__(self) -> int:
-        return len(self.events)
+        return len(self._raw_events)
 
     def __iter__(self):
         return iter(self.events)
@@ -1,15 +1,62 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import date
-from typing import Any, List, Optional, Sequence, Union
+from functools import cached_property
+from typing import Any, Iterable, List, Optional, Sequence, Union
 
+from ._pandas import (
+    categorical_column,
+    empty_frame,
+    frame_from_columns,
+    require_pandas,
+)
+
+
+# Bound once at import: the parsers below call it per row.
+_fromisoformat = date.fromisoformat
+
+
+# Owner rows repeat a handful of enumeration values (entity and relation
+# types, form types) and the same owner names across dates; json returns
+# each as a fresh str, so they are interned to share one object per value.
+def _intern(s: Any) -> Any:
+    """Return the interned copy of *s* when it is a string, else *s*."""
+    return sys.intern(s) if s.__class__ is str else s
+
+
+def _cached_date(raw: str, cache: dict[str, date]) -> date:
+    """Parse an ISO date once per distinct string within *cache*."""
+    parsed = cache.get(raw)
+    if parsed is None:
+        parsed = cache[raw] = _fromisoformat(raw)
+    return parsed
+
+
+def _datetime64_column(dates: list[date]):
+    """Return *dates* as a ``datetime64[ns]`` array for a DataFrame column.
+
+    numpy converts ``date`` objects slowly, one by one; rows share few
+    distinct dates, so each is converted once and the rest is a take.
+    """
+    import numpy as np  # always available alongside pandas
+
+    codes: dict[date, int] = {}
+    index = [codes.setdefault(d, len(codes)) for d in dates]
+    distinct = np.array(list(codes), dtype="datetime64[D]").astype("datetime64[ns]")
+    return distinct[np.array(index, dtype=np.intp)]
+
+
+# The _from_dict / _from_* builders below call constructors positionally, in
+# field order: keyword-argument marshalling dominated construction time for
+# these per-owner records.
 
 # ---------------------------------------------------------------------------
 # High-level event summary  (one row per event date: asOf, ffFactor, etc.)
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FreeFloatEventSummary:
     """High-level aggregate for a single free-float event date.
 
@@ -31,20 +78,19 @@ class FreeFloatEventSummary:
 
     @classmethod
     def _from_event(cls, ev: dict[str, Any]) -> FreeFloatEventSummary:
-        ff = ev.get("ffFactor")
-        dff = ev.get("deltaFfFactor")
-        delta_fff_bps = None
-        if ff is not None and dff is not None and ff != 0:
-            delta_fff_bps = (dff / ff) * 100 * 100
+        get = ev.get
+        ff = get("ffFactor")
+        dff = get("deltaFfFactor")
+        delta_fff_bps = (dff / ff) * 1e4 if ff and dff is not None else None
         return cls(
-            as_of=date.fromisoformat(ev["asOf"]),
-            excluded_shares=ev.get("excludedShares"),
-            ff_factor=ff,
-            delta_shares=ev.get("deltaShares"),
-            delta_ff_factor=dff,
-            delta_fff_bps=delta_fff_bps,
-            is_rebal=ev.get("isRebalanced", False),
-            shares_out=ev.get("sharesOut"),
+            _fromisoformat(ev["asOf"]),
+            get("excludedShares"),
+            ff,
+            get("deltaShares"),
+            dff,
+            delta_fff_bps,
+            get("isRebalanced", False),
+            get("sharesOut"),
         )
 
 
@@ -52,7 +98,7 @@ class FreeFloatEventSummary:
 # Simple / flat view  (first-level components only, no nested drill-down)
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FreeFloatOwnerSummary:
     """Flat summary of one owner within a single free-float event date.
 
@@ -77,27 +123,74 @@ class FreeFloatOwnerSummary:
     source_event: Optional[str] = None
     event_id: Optional[str] = None
 
-    @classmethod
-    def _from_component(
-        cls, as_of: date, owner_id: str, c: dict[str, Any]
-    ) -> FreeFloatOwnerSummary:
-        return cls(
-            as_of=as_of,
-            owner_identity_id=owner_id,
-            name=c.get("name", ""),
-            shares=c.get("shares", 0.0),
-            delta_shares=c.get("deltaShares", 0.0),
-            entity_type=c.get("entityType", ""),
-            rel_type=c.get("relType", ""),
-            event_mask=c.get("eventMask", 0),
-            is_officer=c.get("isOfficer", False),
-            is_extra_owner=c.get("isExtraOwner", False),
-            is_new_owner=c.get("isNewOwner", False),
-            incomplete_event=c.get("incompleteEvent", False),
-            filing_date=c.get("filingDate"),
-            source_event=c.get("sourceEvent"),
-            event_id=c.get("id"),
-        )
+
+# FreeFloatEvents keeps owner rows column-wise under these names, in
+# FreeFloatOwnerSummary field order; the DataFrame uses the same names.
+_OWNER_FIELDS = tuple(f.name for f in fields(FreeFloatOwnerSummary))
+
+# Column dtypes for the frames returned when there are no rows.
+_EVENT_SUMMARY_SCHEMA = {
+    "as_of": "datetime64[ns]",
+    "excluded_shares": "float64",
+    "ff_factor": "float64",
+    "delta_shares": "float64",
+    "delta_ff_factor": "float64",
+    "delta_fff_bps": "float64",
+    "is_rebal": "bool",
+    "shares_out": "float64",
+}
+_OWNER_SCHEMA = {
+    "as_of": "datetime64[ns]",
+    "owner_identity_id": str,
+    "name": str,
+    "shares": "float64",
+    "delta_shares": "float64",
+    "entity_type": str,
+    "rel_type": str,
+    "event_mask": "int64",
+    "is_officer": "bool",
+    "is_extra_owner": "bool",
+    "is_new_owner": "bool",
+    "incomplete_event": "bool",
+    "filing_date": str,
+    "source_event": str,
+    "event_id": str,
+}
+_CATEGORICAL_OWNER_COLUMNS = ("entity_type", "rel_type", "source_event")
+
+# The event-level keys read by event_summaries, the summary frame and dates();
+# FreeFloatEvents keeps only these once an event's owner rows are built.
+_EVENT_SUMMARY_KEYS = (
+    "asOf",
+    "excludedShares",
+    "ffFactor",
+    "deltaShares",
+    "deltaFfFactor",
+    "isRebalanced",
+    "sharesOut",
+)
+
+
+def _owner_row(as_of: date, owner_id: str, c: dict[str, Any]) -> tuple:
+    """Return one owner's FreeFloatOwnerSummary values, in field order."""
+    get = c.get
+    return (
+        as_of,
+        owner_id,
+        _intern(get("name", "")),
+        get("shares", 0.0),
+        get("deltaShares", 0.0),
+        _intern(get("entityType", "")),
+        _intern(get("relType", "")),
+        get("eventMask", 0),
+        get("isOfficer", False),
+        get("isExtraOwner", False),
+        get("isNewOwner", False),
+        get("incompleteEvent", False),
+        get("filingDate"),
+        get("sourceEvent"),
+        get("id"),
+    )
 
 
 @dataclass(frozen=True)
@@ -109,69 +202,159 @@ class FreeFloatEvents:
       excludedShares, deltaShares, deltaFfFactor, sharesOut). Use
       :meth:`to_event_summary_dataframe` for a DataFrame.
     - :attr:`owners`: one row per owner per date. Use :meth:`to_dataframe`.
+
+    Owner rows are stored column-wise; :attr:`owners` builds the
+    :class:`FreeFloatOwnerSummary` objects on first access, and
+    :meth:`to_dataframe` reads the columns without building them.  Of each
+    raw event only the scalar summary fields are kept, so the nested owner
+    payload is not held twice.
     """
 
     ticker: str
     security_id: str
-    event_summaries: tuple[FreeFloatEventSummary, ...]
-    owners: tuple[FreeFloatOwnerSummary, ...]
+    _owner_columns: dict[str, list] = field(repr=False, compare=False)
+    _raw_events: tuple[dict[str, Any], ...] = field(repr=False, compare=False)
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> FreeFloatEvents:
-        event_summaries_list: list[FreeFloatEventSummary] = []
-        owner_summaries: list[FreeFloatOwnerSummary] = []
-        for ev in d.get("events", []):
-            ev_date = date.fromisoformat(ev["asOf"])
-            event_summaries_list.append(FreeFloatEventSummary._from_event(ev))
-            for owner_id, comp in ev.get("components", {}).items():
-                owner_summaries.append(
-                    FreeFloatOwnerSummary._from_component(
-                        ev_date, owner_id, comp
-                    )
-                )
+        return cls._from_events(d["ticker"], d["securityId"], d.get("events", []))
+
+    @classmethod
+    def _from_events(
+        cls,
+        ticker: str,
+        security_id: str,
+        events: Iterable[dict[str, Any]],
+    ) -> FreeFloatEvents:
+        """Build from an iterable of raw event dicts (e.g. a streaming parse).
+
+        Each event is reduced to its summary keys once its owner rows are
+        built; the input dicts are not modified.
+        """
+        raw_events: list[dict[str, Any]] = []
+        columns: tuple[list, ...] = tuple([] for _ in _OWNER_FIELDS)
+        # Bound once: this loop runs per owner row on large payloads.
+        add_event = raw_events.append
+        owner_row = _owner_row
+        fromisoformat = _fromisoformat
+        summary_keys = _EVENT_SUMMARY_KEYS
+        for ev in events:
+            components = ev.get("components")
+            if components:
+                ev_date = fromisoformat(ev["asOf"])
+                # Transpose one event's rows at a time, so only that
+                # event's row tuples are alive next to the columns.
+                rows = [owner_row(ev_date, oid, c) for oid, c in components.items()]
+                for column, values in zip(columns, zip(*rows)):
+                    column.extend(values)
+            add_event({k: ev[k] for k in summary_keys if k in ev})
         return cls(
-            ticker=d["ticker"],
-            security_id=d["securityId"],
-            event_summaries=tuple(event_summaries_list),
-            owners=tuple(owner_summaries),
+            ticker=ticker,
+            security_id=security_id,
+            _owner_columns=dict(zip(_OWNER_FIELDS, columns)),
+            _raw_events=tuple(raw_events),
+        )
+
+    @cached_property
+    def owners(self) -> tuple[FreeFloatOwnerSummary, ...]:
+        """One summary per owner per event date, built on first access."""
+        return tuple(map(FreeFloatOwnerSummary, *self._owner_columns.values()))
+
+    @cached_property
+    def event_summaries(self) -> tuple[FreeFloatEventSummary, ...]:
+        """One summary per event date, built on first access."""
+        return tuple(FreeFloatEventSummary._from_event(ev) for ev in self._raw_events)
+
+    def __eq__(self, other: object) -> bool:
+        # Compare the parsed views rather than the retained raw fields.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.ticker == other.ticker
+            and self.security_id == other.security_id
+            and self._owner_columns == other._owner_columns
+            and self.event_summaries == other.event_summaries
         )
 
+    @cached_property
+    def _frames(self) -> dict[tuple, Any]:
+        # DataFrames already built for this instance, keyed by method and
+        # arguments; callers receive deep copies.
+        return {}
+
+    def _cached_frame(self, key: tuple, build):
+        frames = self._frames
+        df = frames.get(key)
+        if df is None:
+            df = frames[key] = build()
+        # A deep copy: without copy-on-write (pandas < 3) a shallow one
+        # shares its blocks, so in-place edits would reach the cached frame.
+        return df.copy()
+
     def to_event_summary_dataframe(self, sort: bool = True):
         """High-level event summary — one row per event date.
 
         Columns: as_of, excluded_shares, ff_factor, delta_shares,
         delta_ff_factor, shares_out.  Sorted descending by as_of when
         *sort* is True.
+
+        The frame is built once per *sort* value; each call returns its
+        own copy, which may be modified freely.
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                "pandas is required for to_event_summary_dataframe(). "
-                "Install it with:  pip install 'datawiserai[pandas]'"
-            ) from None
-
-        rows = [
+        return self._cached_frame(
+            ("events", sort), lambda: self._event_summary_dataframe(sort)
+        )
+
+    def _event_summary_dataframe(self, sort: bool):
+        pd = require_pandas("to_event_summary_dataframe")
+        import numpy as np  # always available alongside pandas
+
+        # Columns come straight from the raw events, so the DataFrame path
+        # never builds FreeFloatEventSummary objects.
+        raw = self._raw_events
+        n = len(raw)
+        if not n:
+            return empty_frame(pd, _EVENT_SUMMARY_SCHEMA)
+        as_of = [None] * n
+        excluded_shares = [None] * n
+        ff_factor = [None] * n
+        delta_shares = [None] * n
+        delta_ff_factor = [None] * n
+        is_rebal = [None] * n
+        shares_out = [None] * n
+        for i, ev in enumerate(raw):
+            get = ev.get
+            as_of[i] = ev["asOf"]
+            excluded_shares[i] = get("excludedShares")
+            ff_factor[i] = get("ffFactor")
+            delta_shares[i] = get("deltaShares")
+            delta_ff_factor[i] = get("deltaFfFactor")
+            is_rebal[i] = get("isRebalanced", False)
+            shares_out[i] = get("sharesOut")
+        df = pd.DataFrame(
             {
-                "as_of": e.as_of,
-                "excluded_shares": e.excluded_shares,
-                "ff_factor": e.ff_factor,
-                "delta_shares": e.delta_shares,
-                "delta_ff_factor": e.delta_ff_factor,
-                "delta_fff_bps": e.delta_fff_bps,
-                "is_rebal": e.is_rebal,
-                "shares_out": e.shares_out,
+                "as_of": np.array(as_of, dtype="datetime64[D]").astype(
+                    "datetime64[ns]"
+                ),
+                "excluded_shares": excluded_shares,
+                "ff_factor": ff_factor,
+                "delta_shares": delta_shares,
+                "delta_ff_factor": delta_ff_factor,
+                "delta_fff_bps": None,
+                "is_rebal": is_rebal,
+                "shares_out": shares_out,
             }
-            for e in self.event_summaries
-        ]
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["as_of"] = pd.to_datetime(df["as_of"])
-            if sort:
-                df = df.sort_values("as_of", ascending=False).reset_index(drop=True)
+        )
+        # Same formula as FreeFloatEventSummary, for the whole column at
+        # once: NaN where either factor is missing or ff_factor is zero.
+        ff = df["ff_factor"].astype("float64")
+        dff = df["delta_ff_factor"].astype("float64")
+        df["delta_fff_bps"] = (dff / ff.where(ff != 0)) * 1e4
+        if sort:
+            df = df.sort_values("as_of", ascending=False, ignore_index=True)
         return df
 
-    def to_dataframe(self, sort: bool = True):
+    def to_dataframe(self, sort: bool = True, categorical: bool = False):
         """Flat DataFrame — one row per owner per event date.
 
         Parameters
@@ -179,50 +362,51 @@ class FreeFloatEvents:
         sort : bool
             If *True* (default) rows are sorted descending by date
             (most recent first), then by owner name, matching the API order.
+        categorical : bool
+            If *True*, the low-cardinality ``entity_type``, ``rel_type`` and
+            ``source_event`` columns are returned as ``category`` dtype.
+
+        The frame is built once per argument combination; each call returns
+        its own copy, which may be modified freely.
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                "pandas is required for to_dataframe(). "
-                "Install it with:  pip install 'datawiserai[pandas]'"
-            ) from None
-
-        rows = [
-            {
-                "as_of": o.as_of,
-                "owner_identity_id": o.owner_identity_id,
-                "name": o.name,
-                "shares": o.shares,
-                "delta_shares": o.delta_shares,
-                "entity_type": o.entity_type,
-                "rel_type": o.rel_type,
-                "event_mask": o.event_mask,
-                "is_officer": o.is_officer,
-                "is_extra_owner": o.is_extra_owner,
-                "is_new_owner": o.is_new_owner,
-                "incomplete_event": o.incomplete_event,
-                "filing_date": o.filing_date,
-                "source_event": o.source_event,
-                "event_id": o.event_id,
-            }
-            for o in self.owners
-        ]
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["as_of"] = pd.to_datetime(df["as_of"])
-            if sort:
-                df = df.sort_values(
-                    ["as_of", "name"], ascending=[False, True]
-                ).reset_index(drop=True)
+        return self._cached_frame(
+            ("owners", sort, categorical),
+            lambda: self._owner_dataframe(sort, categorical),
+        )
+
+    def _owner_dataframe(self, sort: bool, categorical: bool):
+        pd = require_pandas("to_dataframe")
+
+        columns = dict(self._owner_columns)
+        if not columns["as_of"]:
+            schema = dict(_OWNER_SCHEMA)
+            if categorical:
+                schema.update(dict.fromkeys(_CATEGORICAL_OWNER_COLUMNS, "category"))
+            return empty_frame(pd, schema)
+        columns["as_of"] = _datetime64_column(columns["as_of"])
+        df = frame_from_columns(pd, columns)
+        if categorical:
+            for key in _CATEGORICAL_OWNER_COLUMNS:
+                df[key] = categorical_column(pd, columns[key])
+        if sort:
+            df = df.sort_values(
+                ["as_of", "name"], ascending=[False, True], ignore_index=True
+            )
         return df
 
+    @cached_property
+    def _dates(self) -> tuple[date, ...]:
+        # One raw event per date: dedupe and sort the ISO strings (which
+        # order like dates) and parse only the survivors.
+        iso = sorted({ev["asOf"] for ev in self._raw_events}, reverse=True)
+        return tuple(map(_fromisoformat, iso))
+
     def dates(self) -> list[date]:
         """Return the distinct event dates, most-recent first."""
-        return sorted({o.as_of for o in self.owners}, reverse=True)
+        return list(self._dates)
 
     def __len__(self) -> int:
-        return len(self.owners)
+        return len(self._owner_columns["as_of"])
 
     def __iter__(self):
         return iter(self.owners)
@@ -232,7 +416,7 @@ class FreeFloatEvents:
 # Full / drill-down view  (typed nested structure)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """One sub-component within an owner's components list."""
 
@@ -255,27 +439,28 @@ class Component:
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> Component:
+        get = d.get
         return cls(
-            event_mask=d.get("eventMask", 0),
-            rel_type=d.get("relType", ""),
-            shares=d.get("shares", 0.0),
-            delta_shares=d.get("deltaShares", 0.0),
-            source_event=d.get("sourceEvent", ""),
-            id=d.get("id", ""),
-            event_id=d.get("eventId", ""),
-            is_parent_event=d.get("isParentEvent", False),
-            possible_shared_ownership=d.get("possibleSharedOwnership", False),
-            reconciled=d.get("reconciled", False),
-            is_ben_owner_exclusion=d.get("isBenOwnerExclusion", False),
-            is_cross_holding=d.get("isCrossHolding", False),
-            retained_from=d.get("retainedFrom", []),
-            incomplete_event_retained=d.get("incompleteEventRetained", False),
-            nature_of_ownership=d.get("natureOfOwnership"),
-            entity=d.get("entity"),
+            get("eventMask", 0),
+            _intern(get("relType", "")),
+            get("shares", 0.0),
+            get("deltaShares", 0.0),
+            get("sourceEvent", ""),
+            get("id", ""),
+            get("eventId", ""),
+            get("isParentEvent", False),
+            get("possibleSharedOwnership", False),
+            get("reconciled", False),
+            get("isBenOwnerExclusion", False),
+            get("isCrossHolding", False),
+            get("retainedFrom", []),
+            get("incompleteEventRetained", False),
+            get("natureOfOwnership"),
+            get("entity"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Restriction:
     """One restriction within an owner's restrictions list."""
 
@@ -300,29 +485,30 @@ class Restriction:
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> Restriction:
+        get = d.get
         return cls(
-            event_mask=d.get("eventMask", 0),
-            rel_type=d.get("relType", ""),
-            shares=d.get("shares", 0.0),
-            delta_shares=d.get("deltaShares", 0.0),
-            source_event=d.get("sourceEvent", ""),
-            id=d.get("id", ""),
-            event_id=d.get("eventId", ""),
-            is_parent_event=d.get("isParentEvent", False),
-            is_oversized_shares=d.get("isOversizedShares", False),
-            possible_shared_ownership=d.get("possibleSharedOwnership", False),
-            reconciled=d.get("reconciled", False),
-            is_ben_owner_exclusion=d.get("isBenOwnerExclusion", False),
-            is_cross_holding=d.get("isCrossHolding", False),
-            retained_from=d.get("retainedFrom", []),
-            incomplete_event_retained=d.get("incompleteEventRetained", False),
-            reason=d.get("reason"),
-            included_in_total=d.get("includedInTotal"),
-            restriction_type=d.get("restrictionType"),
+            get("eventMask", 0),
+            _intern(get("relType", "")),
+            get("shares", 0.0),
+            get("deltaShares", 0.0),
+            get("sourceEvent", ""),
+            get("id", ""),
+            get("eventId", ""),
+            get("isParentEvent", False),
+            get("isOversizedShares", False),
+            get("possibleSharedOwnership", False),
+            get("reconciled", False),
+            get("isBenOwnerExclusion", False),
+            get("isCrossHolding", False),
+            get("retainedFrom", []),
+            get("incompleteEventRetained", False),
+            get("reason"),
+            get("includedInTotal"),
+            get("restrictionType"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Option:
     """One option within an owner's options list."""
 
@@ -337,19 +523,20 @@ class Option:
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> Option:
+        get = d.get
         return cls(
-            event_mask=d.get("eventMask"),
-            rel_type=d.get("relType"),
-            shares=d.get("shares"),
-            delta_shares=d.get("deltaShares"),
-            source_event=d.get("sourceEvent"),
-            id=d.get("id"),
-            event_id=d.get("eventId"),
-            raw=d,
+            get("eventMask"),
+            get("relType"),
+            get("shares"),
+            get("deltaShares"),
+            get("sourceEvent"),
+            get("id"),
+            get("eventId"),
+            d,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDetails:
     """Event details for an owner (e.g. form type, transaction code)."""
 
@@ -375,23 +562,24 @@ class EventDetails:
         if not d:
             return None
 
+        get = d.get
         return cls(
-            form_type=d.get("formType"),
-            ir_type=d.get("irType"),
-            notes=d.get("notes"),
-            rel_type=d.get("relType"),
-            file_source=d.get("fileSource"),
-            transaction_date=d.get("transactionDate"),
-            shares_owned_post=d.get("sharesOwnedPost"),
-            delta_shares=d.get("deltaShares"),
-            shares=d.get("shares"),
-            possible_shared_ownership=d.get("possibleSharedOwnership"),
-            is_officer=d.get("isOfficer"),
-            zero_shares_verified=d.get("zeroSharesVerified"),
-            llm_sourced=d.get("llmSourced"),
-            instrument_type=d.get("instrumentType"),
-            instrument_subtype=d.get("instrumentSubtype"),
-            raw=d,
+            _intern(get("formType")),
+            _intern(get("irType")),
+            get("notes"),
+            _intern(get("relType")),
+            get("fileSource"),
+            get("transactionDate"),
+            get("sharesOwnedPost"),
+            get("deltaShares"),
+            get("shares"),
+            get("possibleSharedOwnership"),
+            _intern(get("instrumentType")),
+            _intern(get("instrumentSubtype")),
+            get("isOfficer"),
+            get("zeroSharesVerified"),
+            get("llmSourced"),
+            d,
         )
 
 
@@ -401,6 +589,8 @@ class OwnerDetail:
 
     Attributes
     ----------
+    as_of : date or None
+        The owner's as-of date; None when the payload has no ``asOf``.
     components : List[Component]
         Nested sub-components.
     restrictions : List[Restriction]
@@ -409,9 +599,12 @@ class OwnerDetail:
         Option-related entries.
     event_details : EventDetails or None
         Form/transaction event details.
+
+    The nested attributes above are parsed from the raw payload on first
+    access; most owners in a drill-down are never expanded.
     """
 
-    as_of: date
+    as_of: Optional[date]
     owner_identity_id: str
     shares: float
     event_mask: int
@@ -419,10 +612,12 @@ class OwnerDetail:
     delta_shares: float
     rel_type: str
     name: str
-    components: List[Component] = field(default_factory=list)
-    restrictions: List[Restriction] = field(default_factory=list)
-    options: List[Option] = field(default_factory=list)
-    event_details: Optional[EventDetails] = None
+    _raw_components: List[dict[str, Any]] = field(default_factory=list, repr=False)
+    _raw_restrictions: List[dict[str, Any]] = field(
+        default_factory=list, repr=False
+    )
+    _raw_options: List[dict[str, Any]] = field(default_factory=list, repr=False)
+    _raw_event_details: Optional[dict[str, Any]] = field(default=None, repr=False)
     filing_date: Optional[str] = None
     source_event: Optional[str] = None
     event_id: Optional[str] = None
@@ -433,30 +628,59 @@ class OwnerDetail:
     is_new_owner: bool = False
 
     @classmethod
-    def _from_dict(cls, owner_id: str, d: dict[str, Any]) -> OwnerDetail:
+    def _from_dict(
+        cls,
+        owner_id: str,
+        d: dict[str, Any],
+        dates: Optional[dict[str, date]] = None,
+    ) -> OwnerDetail:
+        get = d.get
+        raw_as_of = get("asOf")
+        if not raw_as_of:
+            as_of = None
+        elif dates is None:
+            as_of = _fromisoformat(raw_as_of)
+        else:
+            as_of = _cached_date(raw_as_of, dates)
         return cls(
-            as_of=date.fromisoformat(d["asOf"]) if d.get("asOf") else date(1970, 1, 1),
-            owner_identity_id=owner_id,
-            shares=d.get("shares", 0.0),
-            event_mask=d.get("eventMask", 0),
-            entity_type=d.get("entityType", ""),
-            delta_shares=d.get("deltaShares", 0.0),
-            rel_type=d.get("relType", ""),
-            name=d.get("name", ""),
-            components=[Component._from_dict(c) for c in d.get("components", [])],
-            restrictions=[Restriction._from_dict(r) for r in d.get("restrictions", [])],
-            options=[Option._from_dict(o) for o in d.get("options", [])],
-            event_details=EventDetails._from_dict(d.get("eventDetails")),
-            filing_date=d.get("filingDate"),
-            source_event=d.get("sourceEvent"),
-            event_id=d.get("id"),
-            incomplete_event=d.get("incompleteEvent", False),
-            source_spans_dates=d.get("sourceSpansDates", False),
-            is_officer=d.get("isOfficer", False),
-            is_extra_owner=d.get("isExtraOwner", False),
-            is_new_owner=d.get("isNewOwner", False),
+            as_of,
+            owner_id,
+            get("shares", 0.0),
+            get("eventMask", 0),
+            _intern(get("entityType", "")),
+            get("deltaShares", 0.0),
+            _intern(get("relType", "")),
+            _intern(get("name", "")),
+            get("components", []),
+            get("restrictions", []),
+            get("options", []),
+            get("eventDetails"),
+            get("filingDate"),
+            get("sourceEvent"),
+            get("id"),
+            get("incompleteEvent", False),
+            get("sourceSpansDates", False),
+            get("isOfficer", False),
+            get("isExtraOwner", False),
+            get("isNewOwner", False),
         )
 
+    @cached_property
+    def components(self) -> List[Component]:
+        return [Component._from_dict(c) for c in self._raw_components]
+
+    @cached_property
+    def restrictions(self) -> List[Restriction]:
+        return [Restriction._from_dict(r) for r in self._raw_restrictions]
+
+    @cached_property
+    def options(self) -> List[Option]:
+        return [Option._from_dict(o) for o in self._raw_options]
+
+    @cached_property
+    def event_details(self) -> Optional[EventDetails]:
+        return EventDetails._from_dict(self._raw_event_details)
+
 
 @dataclass
 class FreeFloatEventDetail:
@@ -471,8 +695,9 @@ class FreeFloatEventDetail:
         Keyed by ``ownerIdentityId``.  Each value is a typed :class:`OwnerDetail`
         with :attr:`OwnerDetail.components`, :attr:`OwnerDetail.restrictions`,
         :attr:`OwnerDetail.options`, and :attr:`OwnerDetail.event_details`.
-    raw : dict
-        The original top-level event dict (for backward compatibility).
+    raw : dict or None
+        The original top-level event dict (for backward compatibility);
+        None when parsed with ``keep_raw=False``.
     """
 
     as_of: date
@@ -485,26 +710,36 @@ class FreeFloatEventDetail:
     delta_ff_factor: float = 0.0
     is_rebal: bool = False
     delta: dict[str, dict[str, Union[float, str]]] = field(default_factory=dict)
-    raw: dict = None
+    raw: Optional[dict[str, Any]] = None
 
     @classmethod
-    def _from_dict(cls, d: dict[str, Any]) -> FreeFloatEventDetail:
-        comps = d.get("components", {})
+    def _from_dict(
+        cls,
+        d: dict[str, Any],
+        dates: Optional[dict[str, date]] = None,
+        keep_raw: bool = True,
+    ) -> FreeFloatEventDetail:
+        # Owners on the same event usually share their asOf string, so each
+        # distinct date is parsed once (across all events when the caller
+        # passes a shared *dates* cache).
+        if dates is None:
+            dates = {}
+        get = d.get
         return cls(
-            as_of=date.fromisoformat(d["asOf"]),
-            security_id=d.get("securityId", ""),
-            components={
-                oid: OwnerDetail._from_dict(oid, c)
-                for oid, c in comps.items()
+            _cached_date(d["asOf"], dates),
+            get("securityId", ""),
+            {
+                oid: OwnerDetail._from_dict(oid, c, dates)
+                for oid, c in get("components", {}).items()
             },
-            shares_out=d.get("sharesOut", 0.0),
-            ff_factor=d.get("ffFactor", 0.0),
-            excluded_shares=d.get("excludedShares", 0.0),
-            delta_shares=d.get("deltaShares", 0.0),
-            delta_ff_factor=d.get("deltaFfFactor", 0.0),
-            delta=d.get("delta", {}),
-            is_rebal=d.get("isRebalanced", False),
-            raw=d,
+            get("sharesOut", 0.0),
+            get("ffFactor", 0.0),
+            get("excludedShares", 0.0),
+            get("deltaShares", 0.0),
+            get("deltaFfFactor", 0.0),
+            get("isRebalanced", False),
+            get("delta", {}),
+            d if keep_raw else None,
         )
 
     @property
@@ -520,16 +755,37 @@ class FreeFloatEventDetail:
         """Return the typed :class:`OwnerDetail` for a single owner."""
         return self.components[owner_id]
 
+    @cached_property
+    def _owner_by_name(self) -> dict[str, OwnerDetail]:
+        by_name: dict[str, OwnerDetail] = {}
+        for owner in self.components.values():
+            # Keep the first owner with a given name, as a linear scan would.
+            by_name.setdefault(owner.name, owner)
+        return by_name
+
     def owner_from_name(self, name: str) -> OwnerDetail:
-        return next(owner for owner in self.components.values() if owner.name == name)
-        raise ValueError(f"No owner found with name {name}")
+        """Return the first :class:`OwnerDetail` whose name is *name*.
 
-    def owner_delta(self, owner_id: str) -> dict[str, Union[float, str]]:
-        owner_delta = {}
+        Raises :class:`ValueError` if no owner has that name.
+        """
+        try:
+            return self._owner_by_name[name]
+        except KeyError:
+            raise ValueError(f"No owner found with name {name}") from None
+
+    @cached_property
+    def _delta_by_owner(self) -> dict[str, dict[str, Union[float, str]]]:
+        # ``delta`` maps each key ("diff", "src", ...) to {owner_id: value};
+        # invert it once so each owner lookup is a single dict access.
+        index: dict[str, dict[str, Union[float, str]]] = {}
         for key, value in self.delta.items():
-            if owner_id in value:
-                owner_delta[key] = value[owner_id]
-        return owner_delta
+            if isinstance(value, dict):
+                for owner_id, v in value.items():
+                    index.setdefault(owner_id, {})[key] = v
+        return index
+
+    def owner_delta(self, owner_id: str) -> dict[str, Union[float, str]]:
+        return dict(self._delta_by_owner.get(owner_id, ()))
 
 
 @dataclass
@@ -557,29 +813,41 @@ class FreeFloatEventsDetail:
     events: tuple[FreeFloatEventDetail, ...]
 
     @classmethod
-    def _from_dict(cls, d: dict[str, Any]) -> FreeFloatEventsDetail:
+    def _from_dict(
+        cls, d: dict[str, Any], keep_raw: bool = True
+    ) -> FreeFloatEventsDetail:
+        dates: dict[str, date] = {}
         return cls(
             ticker=d["ticker"],
             security_id=d["securityId"],
             events=tuple(
-                FreeFloatEventDetail._from_dict(ev)
+                FreeFloatEventDetail._from_dict(ev, dates, keep_raw)
                 for ev in d.get("events", [])
             ),
         )
 
+    @cached_property
+    def _dates(self) -> tuple[date, ...]:
+        return tuple(sorted({ev.as_of for ev in self.events}, reverse=True))
+
     @property
     def dates(self) -> list[date]:
         """Distinct event dates, most-recent first."""
-        return sorted({ev.as_of for ev in self.events}, reverse=True)
+        return list(self._dates)
+
+    @cached_property
+    def _by_date(self) -> dict[date, FreeFloatEventDetail]:
+        # First event wins on a repeated date, as the former linear scan did.
+        index: dict[date, FreeFloatEventDetail] = {}
+        for ev in self.events:
+            index.setdefault(ev.as_of, ev)
+        return index
 
     def by_date(self, as_of: date | str) -> FreeFloatEventDetail | None:
         """Look up the event for a specific date."""
         if isinstance(as_of, str):
-            as_of = date.fromisoformat(as_of)
-        for ev in self.events:
-            if ev.as_of == as_of:
-                return ev
-        return None
+            as_of = _fromisoformat(as_of)
+        return self._by_date.get(as_of)
 
     def __len__(self) -> int:
         return len(self.events)
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompanyInfo:
     """Company-level metadata."""
 
@@ -35,7 +35,7 @@ class CompanyInfo:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecurityInfo:
     """Security-level metadata."""
 
@@ -62,7 +62,7 @@ class SecurityInfo:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reference:
     """Reference / identifier data for a single security.
 
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Optional
+from functools import cached_property
+from operator import itemgetter
+from typing import Any, Optional, Sequence
 
+from ._pandas import categorical_column, empty_frame, require_pandas
 
-@dataclass(frozen=True)
+
+_fromisoformat = date.fromisoformat
+
+
+def _as_of_key(e: dict[str, Any]) -> str:
+    return e.get("asOf") or e.get("asOfDate")
+
+
+# The required SharesOutstandingEvent fields, fetched in one C-level call.
+_EVENT_FIELDS = itemgetter("shareType", "shares", "source", "secType", "lastUpdate")
+
+# Column dtypes for the frame returned when there are no events.
+_SCHEMA = {
+    "as_of": "datetime64[ns]",
+    "share_type": str,
+    "shares": "float64",
+    "source": str,
+    "sec_type": str,
+    "last_update": str,
+    "as_of_rs": "datetime64[ns]",
+}
+_CATEGORICAL_COLUMNS = ("share_type", "source", "sec_type")
+
+
+@dataclass(frozen=True, slots=True)
 class SharesOutstandingEvent:
     """A single shares-outstanding observation."""
 
@@ -20,18 +47,19 @@ class SharesOutstandingEvent:
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> SharesOutstandingEvent:
         # Support both asOf and asOfDate for backward compatibility
-        as_of_raw = d.get("asOf") or d.get("asOfDate")
         rs = d.get("asOfDateRs")
         return cls(
-            as_of=date.fromisoformat(as_of_raw),
-            share_type=d["shareType"],
-            shares=d["shares"],
-            source=d["source"],
-            sec_type=d["secType"],
-            last_update=d["lastUpdate"],
-            as_of_rs=date.fromisoformat(rs) if rs else None,
+            _fromisoformat(_as_of_key(d)),
+            *_EVENT_FIELDS(d),
+            _fromisoformat(rs) if rs else None,
         )
 
+    @classmethod
+    def _from_list(
+        cls, events: Sequence[dict[str, Any]]
+    ) -> tuple[SharesOutstandingEvent, ...]:
+        return tuple(map(cls._from_dict, events))
+
 
 @dataclass(frozen=True)
 class SharesOutstanding:
@@ -49,63 +77,97 @@ class SharesOutstanding:
 
     ticker: str
     security_id: str
-    events: tuple[SharesOutstandingEvent, ...]
+    _raw_events: tuple[dict[str, Any], ...] = field(repr=False, hash=False)
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> SharesOutstanding:
         return cls(
             ticker=d["ticker"],
             security_id=d["securityId"],
-            events=tuple(
-                SharesOutstandingEvent._from_dict(e) for e in d["events"]
-            ),
+            _raw_events=tuple(d["events"]),
         )
 
-    def to_dataframe(self, sort: bool = True):
+    @cached_property
+    def _sorted_events(self) -> tuple[dict[str, Any], ...]:
+        # Raw events most-recent first, for latest() and sorted frames.  The
+        # API already sends this order, so the stable sort is one linear
+        # pass and events sharing a date keep their API order.
+        return tuple(sorted(self._raw_events, key=_as_of_key, reverse=True))
+
+    @cached_property
+    def events(self) -> tuple[SharesOutstandingEvent, ...]:
+        """Parsed events, built from the raw payload on first access."""
+        return SharesOutstandingEvent._from_list(self._raw_events)
+
+    def to_dataframe(self, sort: bool = True, categorical: bool = False):
         """Convert to a :class:`pandas.DataFrame`.
 
         Parameters
         ----------
         sort : bool
             If *True* (default) rows are sorted descending by ``as_of``
-            (most recent first), matching the API order.
+            (most recent first); otherwise they keep the API order of
+            :attr:`events`.
+        categorical : bool
+            If *True*, the low-cardinality ``share_type``, ``source`` and
+            ``sec_type`` columns are returned as ``category`` dtype.
         """
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                "pandas is required for to_dataframe(). "
-                "Install it with:  pip install 'datawiserai[pandas]'"
-            ) from None
-
-        rows = [
+        pd = require_pandas("to_dataframe")
+        import numpy as np  # always available alongside pandas
+
+        raw = self._sorted_events if sort else self._raw_events
+        n = len(raw)
+        if not n:
+            schema = dict(_SCHEMA)
+            if categorical:
+                schema.update(dict.fromkeys(_CATEGORICAL_COLUMNS, "category"))
+            return empty_frame(pd, schema)
+        as_of = [None] * n
+        share_type = [None] * n
+        shares = [None] * n
+        source = [None] * n
+        sec_type = [None] * n
+        last_update = [None] * n
+        as_of_rs = [None] * n
+        for i, e in enumerate(raw):
+            as_of[i] = e.get("asOf") or e.get("asOfDate")
+            share_type[i] = e["shareType"]
+            shares[i] = e["shares"]
+            source[i] = e["source"]
+            sec_type[i] = e["secType"]
+            last_update[i] = e["lastUpdate"]
+            as_of_rs[i] = e.get("asOfDateRs") or None
+        if categorical:
+            share_type = categorical_column(pd, share_type)
+            source = categorical_column(pd, source)
+            sec_type = categorical_column(pd, sec_type)
+        # Typed numpy columns need no inference pass in pandas: the ISO
+        # strings are parsed in C (None becomes NaT, as a null share count
+        # becomes NaN).
+        return pd.DataFrame(
             {
-                "as_of": e.as_of,
-                "share_type": e.share_type,
-                "shares": e.shares,
-                "source": e.source,
-                "sec_type": e.sec_type,
-                "last_update": e.last_update,
-                "as_of_rs": e.as_of_rs,
+                "as_of": np.array(as_of, dtype="datetime64[D]").astype(
+                    "datetime64[ns]"
+                ),
+                "share_type": share_type,
+                "shares": np.array(shares, dtype=np.float64),
+                "source": source,
+                "sec_type": sec_type,
+                "last_update": last_update,
+                "as_of_rs": np.array(as_of_rs, dtype="datetime64[D]").astype(
+                    "datetime64[ns]"
+                ),
             }
-            for e in self.events
-        ]
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df["as_of"] = pd.to_datetime(df["as_of"])
-            df["as_of_rs"] = pd.to_datetime(df["as_of_rs"])
-            if sort:
-                df = df.sort_values("as_of", ascending=False).reset_index(drop=True)
-        return df
+        )
 
     def latest(self) -> SharesOutstandingEvent | None:
         """Return the most-recent event, or *None* if there are no events."""
-        if not self.events:
+        if not self._raw_events:
             return None
-        return max(self.events, key=lambda e: e.as_of)
+        return SharesOutstandingEvent._from_dict(self._sorted_events[0])
 
     def __len__(self) -> int:
-        return len(self.events)
+        return len(self._raw_events)
 
     def __iter__(self):
         return iter(self.events)
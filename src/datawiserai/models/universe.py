@@ -1,10 +1,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from typing import Any, Optional
 
+from ._pandas import empty_frame, require_pandas
 
-@dataclass(frozen=True)
+
+# Column dtypes for the frame returned by an empty universe.
+_SCHEMA = {
+    "ticker": str,
+    "security_id": str,
+    "last_update": str,
+    "doc_last_update": str,
+}
+
+
+def _ticker_of(item: tuple[str, dict[str, Any]]) -> str:
+    return item[1]["ticker"]
+
+
+@dataclass(frozen=True, slots=True)
 class UniverseEntry:
     """One security in an endpoint's manifest."""
 
@@ -28,23 +45,28 @@ class Universe:
     def _from_manifest(
         cls, endpoint: str, manifest: dict[str, Any]
     ) -> Universe:
-        seen: set[str] = set()
-        entries: list[UniverseEntry] = []
-        for _key, val in manifest.items():
+        # One pass keyed by security id (first listing wins); entries are
+        # only built for the survivors, already in ticker order.
+        by_sid: dict[str, dict[str, Any]] = {}
+        for val in manifest.values():
             sid = val.get("security_id", "")
-            if sid in seen:
-                continue
-            seen.add(sid)
-            entries.append(
-                UniverseEntry(
-                    ticker=val["ticker"],
-                    security_id=sid,
-                    last_update=val["last_update"],
-                    doc_last_update=val.get("doc_last_update"),
-                )
-            )
-        entries.sort(key=lambda e: e.ticker)
-        return cls(endpoint=endpoint, entries=tuple(entries))
+            if sid not in by_sid:
+                by_sid[sid] = val
+        rows = sorted(by_sid.items(), key=_ticker_of)
+        return cls(
+            endpoint=endpoint,
+            entries=tuple(
+                [
+                    UniverseEntry(
+                        val["ticker"],
+                        sid,
+                        val["last_update"],
+                        val.get("doc_last_update"),
+                    )
+                    for sid, val in rows
+                ]
+            ),
+        )
 
     @property
     def tickers(self) -> list[str]:
@@ -53,24 +75,14 @@ class Universe:
 
     def to_dataframe(self):
         """Convert to a :class:`pandas.DataFrame`."""
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError(
-                "pandas is required for to_dataframe(). "
-                "Install it with:  pip install 'datawiserai[pandas]'"
-            ) from None
-
-        rows = [
-            {
-                "ticker": e.ticker,
-                "security_id": e.security_id,
-                "last_update": e.last_update,
-                "doc_last_update": e.doc_last_update,
-            }
-            for e in self.entries
-        ]
-        return pd.DataFrame(rows)
+        pd = require_pandas("to_dataframe")
+
+        if not self.entries:
+            return empty_frame(pd, _SCHEMA)
+        # One tuple per entry, fetched in C, instead of a dict per entry.
+        columns = tuple(_SCHEMA)
+        rows = list(map(attrgetter(*columns), self.entries))
+        return pd.DataFrame.from_records(rows, columns=columns)
 
     def __len__(self) -> int:
         return len(self.entries)
@@ -78,8 +90,15 @@ class Universe:
     def __iter__(self):
         return iter(self.entries)
 
+    @cached_property
+    def _lookup(self) -> frozenset[str]:
+        """Every ticker and security id, for O(1) membership tests."""
+        return frozenset(
+            [e.ticker for e in self.entries] + [e.security_id for e in self.entries]
+        )
+
     def __contains__(self, ticker: str) -> bool:
-        return any(e.ticker == ticker or e.security_id == ticker for e in self.entries)
+        return ticker in self._lookup
 
     def __repr__(self) -> str:
         return (
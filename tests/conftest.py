@@ -0,0 +1,207 @@
+"""Shared fixtures: sample payloads and a local stand-in for the API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+import datawiserai as dw
+from datawiserai import _transport, _transport_async
+
+LAST_UPDATE = "2025-12-01T00:00:00"
+
+
+def _day(i: int) -> str:
+    return (date(2025, 12, 1) - timedelta(days=i)).isoformat()
+
+
+def free_float_payload(n: int = 5, ticker: str = "OLP") -> dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "securityId": f"{ticker}s1",
+        "events": [
+            {
+                "asOf": _day(i),
+                "freeFloatFactor": 0.7 + i / 100,
+                "freeFloatPct": 70.0 + i,
+                "sharesOutstanding": 1e6 + i,
+                "excludedShares": 3e5 - i,
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def shares_outstanding_payload(n: int = 4, ticker: str = "OLP") -> dict[str, Any]:
+    events = []
+    for i in range(n):
+        event = {
+            "shareType": "A" if i % 2 else "B",
+            "shares": 1e6 + i,
+            "source": "10-K",
+            "secType": "Common",
+            "lastUpdate": "2025-12-02",
+            "asOfDateRs": _day(i + 1) if i % 3 == 0 else None,
+        }
+        # Older payloads use asOfDate instead of asOf.
+        event["asOf" if i % 2 else "asOfDate"] = _day(i)
+        events.append(event)
+    return {"ticker": ticker, "securityId": f"{ticker}s1", "events": events}
+
+
+def owner(i: int, j: int) -> dict[str, Any]:
+    return {
+        "name": f"Owner {j}",
+        "shares": 1000.0 * (j + 1),
+        "deltaShares": float(i - j),
+        "entityType": "person" if j % 2 else "fund",
+        "relType": "officer" if j % 2 else "10%",
+        "eventMask": j % 4,
+        "isOfficer": j % 2 == 1,
+        "isExtraOwner": False,
+        "isNewOwner": i == j,
+        "incompleteEvent": False,
+        "filingDate": "2025-01-01",
+        "sourceEvent": "form4" if j % 2 else None,
+        "id": f"ev{i}-{j}",
+        "asOf": _day(3 * i),
+        "components": [{"eventMask": 1, "relType": "direct", "shares": 10.0}],
+        "restrictions": [{"eventMask": 1, "shares": 5.0, "reason": ["lockup"]}],
+        "options": [{"eventMask": 2, "shares": 3.0, "id": "o1"}],
+        "eventDetails": {"formType": "4"} if j % 2 else None,
+    }
+
+
+def free_float_events_payload(
+    n_events: int = 4, n_owners: int = 3, ticker: str = "OLP"
+) -> dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "securityId": f"{ticker}s1",
+        "events": [
+            {
+                "asOf": _day(3 * i),
+                "securityId": f"{ticker}s1",
+                "excludedShares": 1e5 + i,
+                "ffFactor": 0.7 + i / 100,
+                "deltaShares": float(i),
+                "deltaFfFactor": 0.001 * i,
+                "isRebalanced": i == 1,
+                "sharesOut": 1e6,
+                "components": {f"OID{j}": owner(i, j) for j in range(n_owners)},
+                "delta": {"diff": {"OID0": 5.0}},
+            }
+            for i in range(n_events)
+        ],
+    }
+
+
+def reference_payload(ticker: str = "OLP") -> dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "securityId": f"{ticker}s1",
+        "companyName": "One Liberty Properties",
+        "cik": "0000712770",
+        "companyInfo": {"name": "One Liberty Properties"},
+        "securityInfo": {"ticker": ticker},
+    }
+
+
+class FakeAPI:
+    """In-process HTTP server answering like the Datawiser API.
+
+    ``payloads`` maps endpoint -> ticker -> JSON body; each endpoint's
+    manifest lists those tickers stamped with ``last_update``.  Payload
+    responses carry an ``ETag`` and honour ``If-None-Match``.  Every
+    request path is appended to ``hits``.
+    """
+
+    def __init__(self) -> None:
+        self.payloads: dict[str, dict[str, Any]] = {
+            "free-float": {
+                "OLP": free_float_payload(),
+                "TSLA": free_float_payload(3, "TSLA"),
+            },
+            "free-float-events": {"OLP": free_float_events_payload()},
+            "shares-outstanding": {"OLP": shares_outstanding_payload()},
+            "reference": {"OLP": reference_payload()},
+        }
+        self.last_update = LAST_UPDATE
+        self.hits: list[str] = []
+        self.if_none_match: list[str | None] = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                api.hits.append(self.path)
+                parts = self.path.strip("/").split("/")[1:]
+                if parts[0] == "manifest":
+                    body = {
+                        t: {
+                            "ticker": t,
+                            "security_id": p["securityId"],
+                            "last_update": api.last_update,
+                        }
+                        for t, p in api.payloads.get(parts[1], {}).items()
+                    }
+                    return self._send(200, json.dumps(body).encode())
+                api.if_none_match.append(self.headers.get("If-None-Match"))
+                body = api.payloads.get(parts[0], {}).get(parts[1])
+                if body is None:
+                    return self._send(404, b'{"detail": "Not found"}')
+                raw = json.dumps(body).encode()
+                etag = '"' + hashlib.md5(raw).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, b"", etag)
+                self._send(200, raw, etag)
+
+            def _send(self, status: int, raw: bytes, etag: str | None = None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+
+    def payload_hits(self, endpoint: str) -> list[str]:
+        """Request paths for *endpoint* payloads (manifests excluded)."""
+        return [p for p in self.hits if p.startswith(f"/v1/{endpoint}/")]
+
+    def manifest_hits(self, endpoint: str) -> list[str]:
+        return [p for p in self.hits if p == f"/v1/manifest/{endpoint}/updates"]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def api(monkeypatch):
+    server = FakeAPI()
+    monkeypatch.setattr(_transport, "BASE_URL", server.base_url)
+    monkeypatch.setattr(_transport_async, "BASE_URL", server.base_url)
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def client(api, tmp_path):
+    return dw.Client("test-key", cache_dir=tmp_path)
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+import datawiserai as dw
+
+pytest.importorskip("httpx")
+
+
+def run(coro_fn, cache_dir, **kwargs):
+    """Run *coro_fn(client)* against a fresh AsyncClient and close it."""
+
+    async def main():
+        async with dw.AsyncClient("test-key", cache_dir=cache_dir, **kwargs) as c:
+            return await coro_fn(c)
+
+    return asyncio.run(main())
+
+
+def test_batch_free_float_returns_models_in_input_order(api, tmp_path):
+    ffs = run(lambda c: c.batch_free_float(["TSLA", "OLP"]), tmp_path)
+
+    assert [ff.ticker for ff in ffs] == ["TSLA", "OLP"]
+    assert [len(ff) for ff in ffs] == [3, 5]
+    # One manifest download shared by every request.
+    assert len(api.manifest_hits("free-float")) == 1
+
+
+def test_endpoint_methods_match_sync_client(api, tmp_path, client):
+    async def fetch_all(c):
+        return (
+            await c.free_float("OLP"),
+            await c.free_float_events("OLP"),
+            await c.shares_outstanding("OLP"),
+            await c.reference("OLP"),
+        )
+
+    ff, ffe, so, ref = run(fetch_all, tmp_path / "async")
+
+    assert ff == client.free_float("OLP")
+    assert ffe == client.free_float_events("OLP")
+    assert so.events == client.shares_outstanding("OLP").events
+    assert ref == client.reference("OLP")
+
+
+def test_fresh_cache_entry_is_not_refetched(api, tmp_path):
+    run(lambda c: c.free_float("OLP"), tmp_path)
+    run(lambda c: c.free_float("OLP"), tmp_path)
+
+    assert api.payload_hits("free-float") == ["/v1/free-float/OLP"]
+
+
+def test_stale_entry_is_revalidated_with_etag(api, tmp_path):
+    run(lambda c: c.free_float("OLP"), tmp_path)
+    api.last_update = "2025-12-02T00:00:00"
+
+    ff = run(lambda c: c.free_float("OLP"), tmp_path)
+
+    assert len(ff) == 5
+    assert api.if_none_match[0] is None
+    assert api.if_none_match[1] is not None
+    stamp = dw.Client("test-key", cache_dir=tmp_path)._cache.stamp("free-float", "OLP")
+    assert stamp[0] == "2025-12-02T00:00:00"
+
+
+def test_unknown_ticker_raises(api, tmp_path):
+    with pytest.raises(dw.TickerNotFoundError):
+        run(lambda c: c.free_float("NOPE"), tmp_path)
@@ -0,0 +1,153 @@
+import gzip
+
+import pytest
+
+from datawiserai import _cache
+from datawiserai._cache import FileCache
+
+
+def _corrupt_deflate() -> bytes:
+    blob = bytearray(gzip.compress(b'{"last_update": "t1", "data": {}}'))
+    blob[10] = 0xFF  # valid gzip header, invalid deflate block type
+    return bytes(blob)
+
+
+CORRUPT_GZ = {
+    "truncated": gzip.compress(b'{"last_update": "t1", "data": {}}')[:-12],
+    "bad deflate": _corrupt_deflate(),
+    "not gzip": b"garbage",
+    "not an object": gzip.compress(b"[1, 2, 3]"),
+}
+CORRUPT_ZST = {
+    "truncated": "truncated",
+    "not zstd": b"garbage",
+}
+
+
+def test_memory_hits_return_independent_payloads(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("reference", "OLP", {"ticker": "OLP"}, "t1")
+
+    data, _, _ = cache.get("reference", "OLP")
+    data["ticker"] = "mutated"
+
+    assert cache.get("reference", "OLP") == ({"ticker": "OLP"}, "t1", None)
+
+
+def test_memory_layer_is_bounded(tmp_path):
+    cache = FileCache(tmp_path, memory_max=2)
+    for ticker in ("A", "B", "C"):
+        cache.put("free-float", ticker, {"t": ticker}, "t1")
+
+    assert list(cache._memory) == [("free-float", "B"), ("free-float", "C")]
+    # Evicted entries are still served from disk.
+    assert cache.get("free-float", "A")[0] == {"t": "A"}
+
+
+def test_mutating_a_model_does_not_leak_into_later_calls(client):
+    client.reference("OLP").raw["companyName"] = "mutated"
+
+    assert client.reference("OLP").company_name == "One Liberty Properties"
+    assert client.reference("OLP").raw["companyName"] == "One Liberty Properties"
+
+
+@pytest.mark.parametrize("blob", CORRUPT_GZ.values(), ids=CORRUPT_GZ.keys())
+def test_corrupt_gzip_entry_is_a_miss(tmp_path, blob):
+    (tmp_path / "reference").mkdir()
+    (tmp_path / "reference" / "OLP.json.gz").write_bytes(blob)
+    cache = FileCache(tmp_path)
+
+    assert cache.get("reference", "OLP") == (None, None, None)
+    assert cache.stamp("reference", "OLP") == (None, None)
+
+
+@pytest.mark.skipif(_cache.zstandard is None, reason="zstandard not installed")
+@pytest.mark.parametrize("blob", CORRUPT_ZST.values(), ids=CORRUPT_ZST.keys())
+def test_corrupt_zstd_entry_is_a_miss(tmp_path, blob):
+    FileCache(tmp_path).put("reference", "OLP", {"a": 1}, "t1")
+    path = tmp_path / "reference" / "OLP.json.zst"
+    if blob == "truncated":
+        blob = path.read_bytes()[:-8]
+    path.write_bytes(blob)
+
+    assert FileCache(tmp_path).get("reference", "OLP") == (None, None, None)
+
+
+@pytest.mark.parametrize("blob", CORRUPT_GZ.values(), ids=CORRUPT_GZ.keys())
+def test_client_refetches_over_a_corrupt_entry(api, client, tmp_path, blob):
+    client.reference("OLP")
+    for path in (tmp_path / "reference").glob("OLP.json.*"):
+        path.unlink()
+    (tmp_path / "reference" / "OLP.json.gz").write_bytes(blob)
+    fresh = type(client)("test-key", cache_dir=tmp_path)
+
+    assert fresh.reference("OLP").company_name == "One Liberty Properties"
+    assert fresh._cache.get("reference", "OLP")[0] is not None
+
+
+def test_stamp_is_answered_from_the_index(tmp_path):
+    FileCache(tmp_path).put("free-float", "OLP", {"a": 1}, "t1", etag='"e1"')
+    for path in (tmp_path / "free-float").glob("OLP.json.*"):
+        path.unlink()
+
+    # The payload is gone, but a fresh cache still knows its stamp.
+    assert FileCache(tmp_path).stamp("free-float", "OLP") == ("t1", '"e1"')
+
+
+def test_touch_restamps_without_rewriting_the_payload(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("free-float", "OLP", {"a": 1}, "t1", etag='"e1"')
+    (path,) = (tmp_path / "free-float").glob("OLP.json.*")
+    blob = path.read_bytes()
+
+    cache.touch("free-float", "OLP", "t2", '"e1"')
+
+    assert path.read_bytes() == blob
+    assert FileCache(tmp_path).get("free-float", "OLP") == ({"a": 1}, "t2", '"e1"')
+
+
+def test_entries_without_an_index_line_use_their_own_stamp(tmp_path):
+    FileCache(tmp_path).put("free-float", "OLP", {"a": 1}, "t1", etag='"e1"')
+    (tmp_path / "free-float" / "index.jsonl").unlink()
+
+    cache = FileCache(tmp_path)
+    assert cache.stamp("free-float", "OLP") == ("t1", '"e1"')
+    # The stamp read from the payload is written back to the index.
+    assert b'"OLP"' in (tmp_path / "free-float" / "index.jsonl").read_bytes()
+
+
+def test_torn_index_line_is_ignored_and_rewritten(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("free-float", "OLP", {"a": 1}, "t1")
+    index = tmp_path / "free-float" / "index.jsonl"
+    with open(index, "ab") as f:
+        f.write(b'{"ticker": "TSLA", "last_upd')
+
+    cache = FileCache(tmp_path)
+    assert cache.stamp("free-float", "OLP") == ("t1", None)
+    cache.put("free-float", "TSLA", {"a": 2}, "t2")
+
+    assert index.read_bytes().count(b"\n") == 2
+    assert FileCache(tmp_path).stamp("free-float", "TSLA") == ("t2", None)
+
+
+def test_index_is_compacted_once_it_holds_enough_superseded_lines(tmp_path):
+    cache = FileCache(tmp_path)
+    last = _cache._INDEX_SLACK + 1
+    for i in range(last + 1):
+        cache.touch("free-float", "OLP", f"t{i}")
+
+    lines = (tmp_path / "free-float" / "index.jsonl").read_bytes().splitlines()
+    assert len(lines) == 1
+    assert FileCache(tmp_path).stamp("free-float", "OLP") == (f"t{last}", None)
+
+
+def test_clear_removes_payloads_and_indexes(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("free-float", "OLP", {"a": 1}, "t1")
+    cache.put("reference", "OLP", {"a": 1}, "t1")
+
+    assert cache.clear("free-float") == 1
+    assert not any((tmp_path / "free-float").iterdir())
+    assert cache.stamp("free-float", "OLP") == (None, None)
+    assert cache.get("reference", "OLP")[0] == {"a": 1}
@@ -0,0 +1,121 @@
+import pytest
+
+import datawiserai as dw
+
+from conftest import free_float_payload
+
+NEW_STAMP = "2025-12-02T00:00:00"
+
+
+def _payload_file(tmp_path, endpoint, ticker):
+    (path,) = (tmp_path / endpoint).glob(f"{ticker}.json.*")
+    return path
+
+
+def test_fresh_entry_is_served_from_cache(api, client):
+    first = client.free_float("OLP")
+    second = dw.Client("test-key", cache_dir=client._cache._dir).free_float("OLP")
+
+    assert first == second
+    assert api.payload_hits("free-float") == ["/v1/free-float/OLP"]
+
+
+def test_stale_unchanged_entry_is_revalidated_with_304(api, client, tmp_path):
+    client.free_float("OLP")
+    etag = client._cache.stamp("free-float", "OLP")[1]
+    blob = _payload_file(tmp_path, "free-float", "OLP").read_bytes()
+    api.last_update = NEW_STAMP
+
+    ff = dw.Client("test-key", cache_dir=tmp_path).free_float("OLP")
+
+    assert etag is not None
+    assert api.if_none_match == [None, etag]
+    assert len(ff) == 5
+    # Only the stamp moves on a 304; the payload file is not rewritten.
+    assert _payload_file(tmp_path, "free-float", "OLP").read_bytes() == blob
+    assert dw.Client("test-key", cache_dir=tmp_path)._cache.stamp(
+        "free-float", "OLP"
+    ) == (NEW_STAMP, etag)
+
+
+def test_stale_changed_entry_is_replaced(api, client, tmp_path):
+    client.free_float("OLP")
+    old_etag = client._cache.stamp("free-float", "OLP")[1]
+    api.last_update = NEW_STAMP
+    api.payloads["free-float"]["OLP"] = free_float_payload(7)
+
+    ff = dw.Client("test-key", cache_dir=tmp_path).free_float("OLP")
+
+    assert len(ff) == 7
+    cached, stamp, etag = dw.Client("test-key", cache_dir=tmp_path)._cache.get(
+        "free-float", "OLP"
+    )
+    assert len(cached["events"]) == 7
+    assert stamp == NEW_STAMP
+    assert etag not in (None, old_etag)
+
+
+def test_304_without_a_cached_payload_refetches(api, client, tmp_path):
+    client.free_float("OLP")
+    api.last_update = NEW_STAMP
+    _payload_file(tmp_path, "free-float", "OLP").unlink()
+
+    ff = dw.Client("test-key", cache_dir=tmp_path).free_float("OLP")
+
+    assert len(ff) == 5
+    # The revalidation got a 304 with nothing left to serve, so the
+    # payload was downloaded again unconditionally.
+    assert api.if_none_match[1] is not None
+    assert api.if_none_match[2] is None
+
+
+def test_uncached_client_never_sends_if_none_match(api, tmp_path):
+    c = dw.Client("test-key", cache_dir=tmp_path, use_cache=False)
+    c.free_float("OLP")
+    c.free_float("OLP")
+
+    assert api.if_none_match == [None, None]
+    assert not (tmp_path / "free-float").exists()
+
+
+def test_map_yields_models_in_input_order(api, client):
+    results = list(client.map("free_float", ["TSLA", "OLP"], workers=2))
+
+    assert [t for t, _ in results] == ["TSLA", "OLP"]
+    assert [len(ff) for _, ff in results] == [3, 5]
+    assert len(api.manifest_hits("free-float")) == 1
+
+
+def test_map_rejects_an_unknown_endpoint_at_call_time(api, client):
+    with pytest.raises(ValueError, match="free-float-events"):
+        client.map("free-flot", ["OLP"])
+
+    assert api.hits == []
+
+
+def test_map_raises_for_a_missing_ticker(api, client):
+    results = client.map("free-float", ["OLP", "NOPE"])
+
+    with pytest.raises(dw.TickerNotFoundError):
+        list(results)
+
+
+def test_batch_returns_each_pairs_model(api, client):
+    ff, so, ref = client.batch(
+        [
+            ("free-float", "OLP"),
+            ("shares_outstanding", "OLP"),
+            ("reference", "OLP"),
+        ]
+    )
+
+    assert isinstance(ff, dw.FreeFloat) and len(ff) == 5
+    assert isinstance(so, dw.SharesOutstanding)
+    assert isinstance(ref, dw.Reference)
+
+
+def test_batch_rejects_an_unknown_endpoint_before_fetching(api, client):
+    with pytest.raises(ValueError, match="Unknown endpoint 'bogus'"):
+        client.batch([("free-float", "OLP"), ("bogus", "OLP")])
+
+    assert api.hits == []
@@ -0,0 +1,93 @@
+import pytest
+
+import datawiserai as dw
+from datawiserai import _cache
+from datawiserai._cache import DEFAULT_MANIFEST_TTL, ManifestCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable replacement for time.monotonic in the cache module."""
+
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+def test_manifest_expires_after_ttl(clock):
+    cache = ManifestCache(60)
+    cache.put("free-float", {"OLP": {}})
+
+    clock.now += 59.9
+    assert cache.get("free-float") == {"OLP": {}}
+    clock.now += 0.1
+    assert cache.get("free-float") is None
+
+
+def test_per_endpoint_ttl_falls_back_to_the_default(clock):
+    cache = ManifestCache({"reference": 3600})
+    cache.put("reference", {})
+    cache.put("free-float", {})
+
+    clock.now += DEFAULT_MANIFEST_TTL
+    assert cache.get("reference") == {}
+    assert cache.get("free-float") is None
+
+
+def test_zero_ttl_disables_caching(clock):
+    cache = ManifestCache({"free-float": 0})
+    cache.put("free-float", {})
+    cache.put_missing("free-float", "NOPE")
+
+    assert cache.get("free-float") is None
+    assert not cache.is_missing("free-float", "NOPE")
+
+
+def test_missing_tickers_expire_and_are_forgotten_on_put(clock):
+    cache = ManifestCache(60)
+    cache.put_missing("free-float", "NOPE")
+    assert cache.is_missing("free-float", "NOPE")
+    assert not cache.is_missing("reference", "NOPE")
+
+    clock.now += 60
+    assert not cache.is_missing("free-float", "NOPE")
+
+    cache.put_missing("free-float", "NOPE")
+    cache.put("free-float", {})
+    assert not cache.is_missing("free-float", "NOPE")
+
+
+def test_client_reuses_the_manifest_within_its_ttl(api, client):
+    client.free_float("OLP")
+    client.free_float("TSLA")
+    client.universe("free_float")
+
+    assert len(api.manifest_hits("free-float")) == 1
+
+
+def test_client_with_zero_ttl_fetches_the_manifest_every_call(api, tmp_path):
+    c = dw.Client("test-key", cache_dir=tmp_path, manifest_ttl={"free_float": 0})
+    c.free_float("OLP")
+    c.free_float("OLP")
+    c.reference("OLP")
+    c.reference("OLP")
+
+    assert len(api.manifest_hits("free-float")) == 2
+    assert len(api.manifest_hits("reference")) == 1
+
+
+def test_client_remembers_missing_tickers(api, client, clock):
+    client.free_float("OLP")
+    clock.now += 50
+    for _ in range(2):
+        with pytest.raises(dw.TickerNotFoundError):
+            client.free_float("NOPE")
+    # The manifest has expired, but the miss recorded at t+50 has not.
+    clock.now += 20
+    with pytest.raises(dw.TickerNotFoundError):
+        client.free_float("NOPE")
+
+    assert len(api.manifest_hits("free-float")) == 1
+    assert api.payload_hits("free-float") == ["/v1/free-float/OLP"]
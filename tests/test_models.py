@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+
+from datawiserai import FreeFloat, FreeFloatEvents, SharesOutstanding
+
+from conftest import (
+    free_float_events_payload,
+    free_float_payload,
+    shares_outstanding_payload,
+)
+
+pd = pytest.importorskip("pandas")
+
+
+def _shuffled(payload, order=(2, 0, 3, 1)):
+    payload = dict(payload)
+    payload["events"] = [payload["events"][i] for i in order]
+    return payload
+
+
+@pytest.mark.parametrize(
+    "model, payload",
+    [
+        (FreeFloat, free_float_payload(4)),
+        (SharesOutstanding, shares_outstanding_payload(4)),
+    ],
+    ids=["free-float", "shares-outstanding"],
+)
+def test_events_keep_api_order_and_sort_is_honoured(model, payload):
+    shuffled = _shuffled(payload)
+    obj = model._from_dict(shuffled)
+    api_dates = [
+        date.fromisoformat(e.get("asOf") or e["asOfDate"]) for e in shuffled["events"]
+    ]
+
+    assert api_dates != sorted(api_dates, reverse=True)
+    assert [e.as_of for e in obj.events] == api_dates
+    assert [e.as_of for e in obj] == api_dates
+    assert obj.latest().as_of == max(api_dates)
+
+    unsorted = obj.to_dataframe(sort=False)["as_of"].dt.date.tolist()
+    by_date = obj.to_dataframe()["as_of"].dt.date.tolist()
+    assert unsorted == api_dates
+    assert by_date == sorted(api_dates, reverse=True)
+
+
+def test_latest_prefers_the_first_of_tied_events():
+    payload = free_float_payload(3)
+    payload["events"][1]["asOf"] = payload["events"][0]["asOf"]
+
+    ff = FreeFloat._from_dict(payload)
+
+    assert ff.latest() == ff.events[0]
+    assert ff.to_dataframe()["free_float_pct"].tolist() == [70.0, 71.0, 72.0]
+
+
+def test_empty_models():
+    ff = FreeFloat._from_dict(free_float_payload(0))
+    so = SharesOutstanding._from_dict(shares_outstanding_payload(0))
+
+    assert ff.latest() is None and so.latest() is None
+    assert ff.to_dataframe().empty and so.to_dataframe(sort=False).empty
+
+
+def test_free_float_events_keep_only_event_summary_fields():
+    payload = free_float_events_payload(3, 2)
+
+    ffe = FreeFloatEvents._from_dict(payload)
+
+    assert all("components" not in ev for ev in ffe._raw_events)
+    assert all("delta" not in ev for ev in ffe._raw_events)
+    # The caller's payload is left intact.
+    assert all(ev["components"] for ev in payload["events"])
+    assert len(ffe) == 6
+    summary = ffe.event_summaries[1]
+    assert (summary.ff_factor, summary.is_rebal, summary.shares_out) == (
+        0.71,
+        True,
+        1e6,
+    )
+    assert ffe.dates() == sorted(ffe.dates(), reverse=True)
+
+
+@pytest.mark.parametrize(
+    "method", ["to_dataframe", "to_event_summary_dataframe"]
+)
+def test_modifying_a_cached_frame_does_not_affect_later_calls(method):
+    ffe = FreeFloatEvents._from_dict(free_float_events_payload())
+    build = getattr(ffe, method)
+    expected = build()
+
+    df = build()
+    df.loc[0, "delta_shares"] = -1.0
+    df["delta_shares"] *= 2
+    df.iloc[1, 0] = pd.Timestamp("1999-01-01")
+
+    pd.testing.assert_frame_equal(build(), expected)
@@ -0,0 +1,72 @@
+import pytest
+
+from datawiserai import FreeFloatEvents
+from datawiserai.models import _pandas
+
+from conftest import free_float_events_payload
+
+pd = pytest.importorskip("pandas")
+
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def frame_builder(request, monkeypatch):
+    """Run a test once through the Arrow build path and once without it."""
+    if request.param == "pyarrow":
+        monkeypatch.setattr(_pandas, "_pa", pytest.importorskip("pyarrow"))
+    else:
+        monkeypatch.setattr(_pandas, "_pa", False)
+    return request.param
+
+
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize("categorical", [False, True])
+def test_owner_frame_is_the_same_with_and_without_pyarrow(
+    frame_builder, monkeypatch, sort, categorical
+):
+    payload = free_float_events_payload(5, 4)
+    df = FreeFloatEvents._from_dict(payload).to_dataframe(sort, categorical)
+
+    monkeypatch.setattr(_pandas, "_pa", False)
+    expected = FreeFloatEvents._from_dict(payload).to_dataframe(sort, categorical)
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert len(df) == 20
+    assert str(df["as_of"].dtype) == "datetime64[ns]"
+    assert df["filing_date"].isna().sum() == 0
+    assert df["source_event"].isna().sum() == 10
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        {"a": [1, "x"], "b": [1.0, 2.0]},
+        {"a": [2**70, 1], "b": [1.0, 2.0]},
+    ],
+    ids=["mixed types", "oversized int"],
+)
+def test_columns_arrow_cannot_type_fall_back(frame_builder, columns):
+    df = _pandas.frame_from_columns(pd, columns)
+
+    pd.testing.assert_frame_equal(df, pd.DataFrame(columns))
+
+
+def test_empty_owner_frame_is_typed(frame_builder):
+    payload = free_float_events_payload(2, 0)
+
+    df = FreeFloatEvents._from_dict(payload).to_dataframe(categorical=True)
+
+    assert df.empty
+    assert str(df["as_of"].dtype) == "datetime64[ns]"
+    assert str(df["entity_type"].dtype) == "category"
+
+
+def test_arrow_path_builds_the_frame_itself(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(_pandas, "_pa", pa)
+    columns = {"a": [1, None], "b": ["x", None], "c": [True, False]}
+
+    # No pandas module is passed, so any fallback would fail.
+    df = _pandas.frame_from_columns(None, columns)
+
+    assert df["a"].tolist()[0] == 1 and pd.isna(df["a"].tolist()[1])
+    assert df["b"].tolist()[0] == "x"
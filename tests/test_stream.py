@@ -0,0 +1,41 @@
+import pytest
+
+import datawiserai as dw
+
+pytest.importorskip("ijson")
+
+
+def test_streamed_events_match_the_buffered_parse(api, tmp_path):
+    streamed = dw.Client("test-key", cache_dir=tmp_path / "a").free_float_events(
+        "OLP", stream=True
+    )
+    buffered = dw.Client("test-key", cache_dir=tmp_path / "b").free_float_events(
+        "OLP"
+    )
+
+    assert streamed == buffered
+    assert len(streamed) == 12
+    assert streamed.event_summaries == buffered.event_summaries
+    assert streamed.dates() == buffered.dates()
+
+
+def test_streamed_payload_is_not_cached(api, client):
+    client.free_float_events("OLP", stream=True)
+    client.free_float_events("OLP", stream=True)
+
+    assert len(api.payload_hits("free-float-events")) == 2
+    assert client._cache.get("free-float-events", "OLP") == (None, None, None)
+
+
+def test_fresh_cache_entry_is_used_instead_of_streaming(api, client):
+    buffered = client.free_float_events("OLP")
+
+    assert client.free_float_events("OLP", stream=True) == buffered
+    assert len(api.payload_hits("free-float-events")) == 1
+
+
+def test_unknown_ticker_raises_before_streaming(api, client):
+    with pytest.raises(dw.TickerNotFoundError):
+        client.free_float_events("NOPE", stream=True)
+
+    assert api.payload_hits("free-float-events") == []